@@ -9,7 +9,7 @@ from flask import Flask, g, request
 from .config import load_config
 from .db import close_db, init_db
 from .errors import register_error_handlers
-from .util import ensure_dirs
+from .util import ensure_dirs, sweep_deferred_rmtrees
 
 
 def _repo_root() -> Path:
@@ -38,6 +38,8 @@ def create_app(test_config: dict[str, Any] | None = None) -> Flask:
         Path(app.config["DB_PATH"]).parent,
         Path(app.config["ARTIFACTS_DIR"]),
     )
+    # Finish deferred artifact deletes a previous process didn't get to.
+    sweep_deferred_rmtrees(Path(app.config["ARTIFACTS_DIR"]))
 
     # Initialize DB + detect FTS once
     with app.app_context():
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import os
+import stat
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Iterable
 
 from .constants import ALLOWED_ARTIFACTS
 
-ALLOWED_ARTIFACTS_SET = set(ALLOWED_ARTIFACTS)
+ALLOWED_ARTIFACTS_SET = frozenset(ALLOWED_ARTIFACTS)
 
 
 def artifact_path(artifacts_root: Path, capture_id: str, name: str) -> Path:
@@ -22,26 +25,63 @@ def list_present_artifacts(
     *,
     artifacts_root: Path,
     capture_id: str,
-    allowed_artifacts: Iterable[str] = ALLOWED_ARTIFACTS,
+    allowed_artifacts: Iterable[str] = ALLOWED_ARTIFACTS_SET,
 ) -> list[str]:
     """
     Lists artifacts that exist on disk for the given capture_id, filtered to allowed_artifacts.
     """
-    allowed = set(allowed_artifacts)
+    # A frozenset (e.g. the default ALLOWED_ARTIFACTS_SET) is used as-is; any other
+    # iterable is normalized once per call, whatever object it happens to be.
+    if isinstance(allowed_artifacts, frozenset):
+        allowed = allowed_artifacts
+    else:
+        allowed = frozenset(allowed_artifacts)
+
     cap_dir = artifacts_root / str(capture_id)
-    if not cap_dir.exists() or not cap_dir.is_dir():
+    # One scandir instead of exists()/is_dir() plus a stat per entry: DirEntry
+    # carries the file type from the directory listing.
+    try:
+        it = os.scandir(cap_dir)
+    except OSError:
         return []
 
-    out: list[str] = []
-    for p in cap_dir.iterdir():
-        if p.is_file() and p.name in allowed:
-            out.append(p.name)
+    with it:
+        out = [e.name for e in it if e.name in allowed and e.is_file()]
 
     # Stable-ish ordering for UI
     out.sort()
     return out
 
 
+@lru_cache(maxsize=32)
+def _read_preview(
+    path_str: str, mtime_ns: int, size: int, max_bytes: int
+) -> tuple[str, bool]:
+    """
+    Decoded (text, truncated) preview. Keyed on mtime/size so a rewritten
+    artifact is re-read; repeat detail-page renders skip the disk + decode.
+    Raises OSError on read failure (not cached).
+    """
+    # Read at most one byte past the cap: enough to detect truncation without
+    # pulling a large artifact fully into memory.
+    with open(path_str, "rb") as f:
+        raw = f.read(max_bytes + 1)
+
+    truncated = False
+    if len(raw) > max_bytes:
+        raw = raw[:max_bytes]
+        truncated = True
+
+    try:
+        text = raw.decode("utf-8", errors="replace")
+    except Exception:
+        text = ""
+
+    if truncated:
+        text = text.rstrip() + "\n… (truncated)"
+    return text, truncated
+
+
 def read_text_artifact(
     *,
     artifacts_root: Path,
@@ -55,7 +95,11 @@ def read_text_artifact(
     """
     p = artifact_path(artifacts_root, capture_id, name)
 
-    if not p.exists() or not p.is_file():
+    try:
+        st = p.stat()
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
         return {
             "name": name,
             "exists": False,
@@ -65,7 +109,7 @@ def read_text_artifact(
         }
 
     try:
-        raw = p.read_bytes()
+        text, truncated = _read_preview(str(p), st.st_mtime_ns, st.st_size, max_bytes)
     except Exception:
         return {
             "name": name,
@@ -75,19 +119,6 @@ def read_text_artifact(
             "chars": 0,
         }
 
-    truncated = False
-    if len(raw) > max_bytes:
-        raw = raw[:max_bytes]
-        truncated = True
-
-    try:
-        text = raw.decode("utf-8", errors="replace")
-    except Exception:
-        text = ""
-
-    if truncated:
-        text = text.rstrip() + "\n… (truncated)"
-
     return {
         "name": name,
         "exists": True,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -23,6 +24,18 @@ def _read_json(p: Path) -> Any:
         return None
 
 
+# Short strings (section titles/kinds like "Introduction", "methods") repeat across
+# nearly every bundle; interning lets multi-capture exports share one copy each.
+_INTERN_MAX_LEN = 64
+
+
+def _intern_short_values(d: dict[str, Any]) -> dict[str, Any]:
+    for k, v in d.items():
+        if isinstance(v, str) and len(v) < _INTERN_MAX_LEN:
+            d[k] = sys.intern(v)
+    return d
+
+
 @dataclass(frozen=True)
 class PaperBundle:
     """
@@ -50,6 +63,15 @@ class PaperBundle:
     def cap_dir_for(artifacts_root: Path, capture_id: str) -> Path:
         return artifacts_root / str(capture_id)
 
+    @classmethod
+    def read_paper_md(cls, *, artifacts_root: Path, capture_id: str) -> str:
+        """
+        Read just paper.md for a capture (no JSON artifacts). Returns "" if missing.
+        """
+        cap_dir = cls.cap_dir_for(artifacts_root, str(capture_id or "").strip())
+        txt = _read_text(cap_dir / "paper.md").rstrip()
+        return (txt + "\n") if txt else ""
+
     @classmethod
     def load_best_effort(
         cls,
@@ -73,7 +95,7 @@ class PaperBundle:
 
             v = _read_json(cap_dir / "sections.json")
             if isinstance(v, list):
-                sections = [x for x in v if isinstance(x, dict)]
+                sections = [_intern_short_values(x) for x in v if isinstance(x, dict)]
 
             v = _read_json(cap_dir / "references.json")
             if isinstance(v, list):
@@ -95,15 +117,17 @@ class PaperBundle:
     # ---- Convenience accessors (prefer reduced.json, fall back to DB row) ----
 
     def title(self) -> str:
-        if self.reduced.get("title"):
-            return str(self.reduced.get("title") or "")
+        v = self.reduced.get("title")
+        if v:
+            return str(v)
         if self.cap_row:
             return str(self.cap_row.get("title") or "")
         return ""
 
     def doi(self) -> str:
-        if self.reduced.get("doi"):
-            return str(self.reduced.get("doi") or "")
+        v = self.reduced.get("doi")
+        if v:
+            return str(v)
         if self.cap_row:
             return str(self.cap_row.get("doi") or "")
         return ""
@@ -125,8 +149,9 @@ class PaperBundle:
         return None
 
     def container_title(self) -> str:
-        if self.reduced.get("container_title"):
-            return str(self.reduced.get("container_title") or "")
+        v = self.reduced.get("container_title")
+        if v:
+            return str(v)
         if self.cap_row:
             return str(self.cap_row.get("container_title") or "")
         return ""
@@ -147,10 +147,7 @@ def build_capture_dto_from_payload(
 
     # Text for indexing/search
     # Stage 4: standardize the text that will be stored in DB (capture_text) + FTS
-    base_text_raw = html_to_text(content_html)
     parsed_text_raw = (parse_result.article_text or "").strip()
-
-    base_text = standardize_text(base_text_raw) if base_text_raw else ""
     parsed_text = standardize_text(parsed_text_raw) if parsed_text_raw else ""
 
     use_parsed_for_index = (
@@ -159,7 +156,12 @@ def build_capture_dto_from_payload(
         and float(parse_result.confidence_fulltext) >= 0.45
     )
 
-    content_text = parsed_text if use_parsed_for_index else base_text
+    if use_parsed_for_index:
+        content_text = parsed_text
+    else:
+        # Only flatten the client's content_html when it is actually what gets indexed.
+        base_text_raw = html_to_text(content_html)
+        content_text = standardize_text(base_text_raw) if base_text_raw else ""
 
     client = payload.get("client") if isinstance(payload.get("client"), dict) else {}
 
@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-import re
+from functools import lru_cache
 from typing import Any
 
 from .metaschema import (
     get_abstract,
     get_authors,
-    normalize_meta_record,
     parse_meta_json as _parse_meta_json,
 )
 
@@ -18,12 +17,20 @@ def _snip_text(s: str, n: int = 200) -> str:
     return s[: n - 1].rstrip() + "…"
 
 
+# Pure and called per author per row on every library page; the same names recur.
+@lru_cache(maxsize=4096)
 def _author_last_name(name: str) -> str:
     name = (name or "").strip()
     if not name:
         return ""
-    parts = re.split(r"\s+", name)
-    return parts[-1].strip(",") if parts else name
+    # "Family, Given" (ingest deliberately doesn't split authors on commas): the
+    # family name comes first.
+    if "," in name:
+        family, _sep, given = name.partition(",")
+        if family.strip() and given.strip():
+            return family.strip()
+    # rsplit from the right stops at the last whitespace run; no full token list.
+    return name.rsplit(None, 1)[-1].strip(",")
 
 
 def _format_authors_apa_short(authors: list[str]) -> str:
@@ -37,24 +44,13 @@ def _format_authors_apa_short(authors: list[str]) -> str:
     return f"{_author_last_name(authors[0])} et al."
 
 
-def citation_fields_from_meta(meta: dict[str, Any]) -> dict[str, str]:
+def citation_fields_from_parts(*, authors: list[str], abstract: str) -> dict[str, str]:
     """
-    Accepts either:
-      - the normalized meta record (recommended), OR
-      - a loosely-shaped dict
-
-    Produces stable display fields for UI.
+    Display fields from an already-extracted author list + abstract (e.g. the
+    DTO's "authors"/"abstract"), so callers holding a DTO skip re-walking meta.
     """
-    if not isinstance(meta, dict):
-        meta = {}
-
-    meta = normalize_meta_record(meta)
-
-    authors = get_authors(meta)
     authors_str = ", ".join(authors) if authors else ""
     authors_short = _format_authors_apa_short(authors)
-
-    abstract = get_abstract(meta)
     abstract_snip = _snip_text(abstract, 220) if abstract else ""
 
     return {
@@ -64,9 +60,26 @@ def citation_fields_from_meta(meta: dict[str, Any]) -> dict[str, str]:
     }
 
 
+def citation_fields_from_meta(meta: dict[str, Any]) -> dict[str, str]:
+    """
+    Accepts either:
+      - the normalized meta record (recommended), OR
+      - a loosely-shaped dict
+
+    Produces stable display fields for UI.
+    """
+    if not isinstance(meta, dict):
+        meta = {}
+
+    # get_authors/get_abstract accept either shape, so there's no need to run the
+    # whole normalize_meta_record (head-meta copy, keywords, client) per call.
+    return citation_fields_from_parts(
+        authors=get_authors(meta), abstract=get_abstract(meta)
+    )
+
+
 def citation_fields_from_meta_json(meta_json: Any) -> dict[str, str]:
-    meta = normalize_meta_record(_parse_meta_json(meta_json))
-    return citation_fields_from_meta(meta)
+    return citation_fields_from_meta(_parse_meta_json(meta_json))
 
 
 # Back-compat: keep this symbol stable (a few places historically imported it from citation.py)
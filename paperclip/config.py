@@ -49,8 +49,10 @@ def load_config(*, repo_root: Path) -> dict[str, Any]:
       - MAX_CONTENT_LENGTH (bytes)
       - SECRET_KEY
       - DEBUG
+      - USE_X_SENDFILE (let a fronting server send artifact files)
     """
     debug = _env_bool("DEBUG", default=False)
+    use_x_sendfile = _env_bool("USE_X_SENDFILE", default=False)
 
     data_dir = _env_path("DATA_DIR") or (repo_root / "data")
     db_path = _env_path("DB_PATH") or (data_dir / "db.sqlite3")
@@ -76,4 +78,6 @@ def load_config(*, repo_root: Path) -> dict[str, Any]:
         "ARTIFACTS_DIR": artifacts_dir,
         "MAX_CONTENT_LENGTH": max_content_length,
         "SECRET_KEY": secret_key,
+        # Flask's send_file then replies with an X-Sendfile header and no body.
+        "USE_X_SENDFILE": use_x_sendfile,
     }
@@ -41,8 +41,11 @@ CREATE TABLE IF NOT EXISTS collection_items (
   PRIMARY KEY (collection_id, capture_id)
 );
 
-CREATE INDEX IF NOT EXISTS idx_captures_updated_at ON captures(updated_at);
+-- Library pages sort by (updated_at DESC, id DESC); this lets SQLite walk the
+-- index for ORDER BY ... LIMIT instead of sorting the whole table.
+CREATE INDEX IF NOT EXISTS idx_captures_updated_at_id ON captures(updated_at, id);
 CREATE INDEX IF NOT EXISTS idx_captures_doi ON captures(doi);
+CREATE INDEX IF NOT EXISTS idx_captures_url_hash ON captures(url_hash);
 CREATE INDEX IF NOT EXISTS idx_collection_items_capture ON collection_items(capture_id);
 """
 
@@ -60,6 +63,19 @@ CREATE VIRTUAL TABLE IF NOT EXISTS capture_fts USING fts5(
 """
 
 
+COLLECTION_COUNT_TRIGGERS_SQL = """
+CREATE TRIGGER IF NOT EXISTS trg_collection_items_count_ins
+AFTER INSERT ON collection_items BEGIN
+  UPDATE collections SET item_count = item_count + 1 WHERE id = NEW.collection_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_collection_items_count_del
+AFTER DELETE ON collection_items BEGIN
+  UPDATE collections SET item_count = item_count - 1 WHERE id = OLD.collection_id;
+END;
+"""
+
+
 def init_db(db_path: Path) -> bool:
     conn = sqlite3.connect(str(db_path))
     try:
@@ -97,6 +113,32 @@ def init_db(db_path: Path) -> bool:
                 pass
             _mark(mid)
 
+        # Migration: denormalized collections.item_count, kept exact by triggers on
+        # collection_items (FK cascades fire them too), so the sidebar counts are a
+        # plain read instead of a JOIN + GROUP BY on every library page.
+        mid = "2026-10-18_collections_item_count"
+        if not _applied(mid):
+            cols = {r[1] for r in conn.execute("PRAGMA table_info(collections)")}
+            if "item_count" not in cols:
+                conn.execute(
+                    "ALTER TABLE collections ADD COLUMN item_count INTEGER NOT NULL DEFAULT 0"
+                )
+            conn.executescript(COLLECTION_COUNT_TRIGGERS_SQL)
+            conn.execute("""
+                UPDATE collections SET item_count = (
+                  SELECT COUNT(1) FROM collection_items ci
+                  WHERE ci.collection_id = collections.id
+                )
+                """)
+            _mark(mid)
+
+        # Migration: idx_captures_updated_at_id (in SCHEMA_SQL) covers every
+        # updated_at lookup; the single-column prefix index only cost writes.
+        mid = "2026-10-18_drop_idx_captures_updated_at"
+        if not _applied(mid):
+            conn.execute("DROP INDEX IF EXISTS idx_captures_updated_at")
+            _mark(mid)
+
         # Try to enable FTS; app still works without it.
         fts_enabled = True
         try:
@@ -134,14 +176,26 @@ def get_db() -> sqlite3.Connection:
     return g.db
 
 
+def keep_db_open_for_stream() -> None:
+    """
+    Keep this request's connection open past the view's teardown.
+
+    For streamed responses wrapped in stream_with_context: the app context is
+    torn down once when the view returns and again when the stream is drained
+    (or closed); the connection is closed on the second teardown.
+    """
+    g._db_keep_open = True
+
+
 def close_db(_err: Any = None) -> None:
+    if g.pop("_db_keep_open", False):
+        return
     conn = g.pop("db", None)
     if conn is not None:
         conn.close()
 
 
 def rows_to_dicts(rows: Iterable[sqlite3.Row]) -> list[dict[str, Any]]:
-    out: list[dict[str, Any]] = []
-    for r in rows:
-        out.append({k: r[k] for k in r.keys()})
-    return out
+    # sqlite3.Row is a mapping (keys() + __getitem__); dict(r) builds it in C
+    # instead of a per-column comprehension.
+    return [dict(r) for r in rows]
@@ -1,17 +1,20 @@
 from __future__ import annotations
 
 import re
-from typing import Any
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator
 
 from .capture_dto import build_capture_dto_from_row
 
+# Minimal escaping for BibTeX, applied in one pass (same result as the sequential
+# backslash-then-brace-then-quote replaces: inserted backslashes aren't re-escaped).
+_BIBTEX_ESCAPES = str.maketrans({"\\": "\\\\", "{": "\\{", "}": "\\}", '"': '\\"'})
+_WS_RX = re.compile(r"\s+")
+
 
 def _escape_bibtex(s: str) -> str:
-    # Minimal escaping for BibTeX
-    s = s.replace("\\", "\\\\")
-    s = s.replace("{", "\\{").replace("}", "\\}")
-    s = s.replace('"', '\\"')
-    s = re.sub(r"\s+", " ", s).strip()
+    s = s.translate(_BIBTEX_ESCAPES)
+    s = _WS_RX.sub(" ", s).strip()
     return s
 
 
@@ -21,89 +24,111 @@ def _bibtex_key(capture_id: str, year: int | None) -> str:
 
 
 def _norm_abstract(val: str) -> str:
-    return re.sub(r"\s+", " ", (val or "")).strip()
-
-
-def captures_to_bibtex(rows: list[dict[str, Any]]) -> str:
-    entries: list[str] = []
+    return _WS_RX.sub(" ", (val or "")).strip()
+
+
+@dataclass(frozen=True, slots=True)
+class _CitationRecord:
+    id: str
+    title: str
+    url: str
+    doi: str
+    year: int | None
+    journal: str
+    authors: list[str]
+    keywords: list[str]
+    abstract: str
+
+
+def _citation_record(row: dict[str, Any]) -> _CitationRecord:
+    """Project a capture row onto the fields BibTeX/RIS emit, in one pass."""
+    dto = build_capture_dto_from_row(row)
+    year = dto.get("year", None)
+    return _CitationRecord(
+        id=str(dto.get("id") or ""),
+        title=str(dto.get("title") or "").strip(),
+        url=str(dto.get("url") or "").strip(),
+        doi=str(dto.get("doi") or "").strip(),
+        year=year if isinstance(year, int) else None,
+        journal=str(dto.get("container_title") or "").strip(),
+        authors=dto.get("authors") or [],
+        keywords=dto.get("keywords") or [],
+        abstract=_norm_abstract(str(dto.get("abstract") or "")),
+    )
+
+
+def iter_bibtex(rows: Iterable[dict[str, Any]]) -> Iterator[str]:
+    """
+    Yield BibTeX one entry at a time (entries separated by a blank line, with a
+    trailing newline when non-empty).
+    """
+    first = True
     for r in rows:
-        dto = build_capture_dto_from_row(r)
-
-        cid = str(dto.get("id") or "")
-        title = str(dto.get("title") or "").strip()
-        url = str(dto.get("url") or "").strip()
-        doi = str(dto.get("doi") or "").strip()
-        year_i = dto.get("year", None)
-        journal = str(dto.get("container_title") or "").strip()
-
-        keywords = dto.get("keywords") or []
-        authors = dto.get("authors") or []
-        abstract = _norm_abstract(str(dto.get("abstract") or ""))
+        c = _citation_record(r)
 
-        entry_type = "article" if journal else "misc"
-        key = _bibtex_key(cid, year_i if isinstance(year_i, int) else None)
+        entry_type = "article" if c.journal else "misc"
+        key = _bibtex_key(c.id, c.year)
 
         fields: list[tuple[str, str]] = []
-        fields.append(("title", _escape_bibtex(title or "Untitled")))
-        if authors:
-            fields.append(("author", _escape_bibtex(" and ".join(authors))))
-        if journal:
-            fields.append(("journal", _escape_bibtex(journal)))
-        if isinstance(year_i, int) and year_i:
-            fields.append(("year", str(year_i)))
-        if doi:
-            fields.append(("doi", _escape_bibtex(doi)))
-        if url:
-            fields.append(("url", _escape_bibtex(url)))
-        if abstract:
-            fields.append(("abstract", _escape_bibtex(abstract)))
-        if keywords:
-            fields.append(("keywords", _escape_bibtex(", ".join(keywords))))
+        fields.append(("title", _escape_bibtex(c.title or "Untitled")))
+        if c.authors:
+            fields.append(("author", _escape_bibtex(" and ".join(c.authors))))
+        if c.journal:
+            fields.append(("journal", _escape_bibtex(c.journal)))
+        if c.year:
+            fields.append(("year", str(c.year)))
+        if c.doi:
+            fields.append(("doi", _escape_bibtex(c.doi)))
+        if c.url:
+            fields.append(("url", _escape_bibtex(c.url)))
+        if c.abstract:
+            fields.append(("abstract", _escape_bibtex(c.abstract)))
+        if c.keywords:
+            fields.append(("keywords", _escape_bibtex(", ".join(c.keywords))))
 
         body = ",\n".join([f"  {k} = {{{v}}}" for k, v in fields])
-        entries.append(f"@{entry_type}{{{key},\n{body}\n}}")
+        entry = f"@{entry_type}{{{key},\n{body}\n}}"
+        yield entry if first else "\n\n" + entry
+        first = False
 
-    return "\n\n".join(entries).strip() + ("\n" if entries else "")
+    if not first:
+        yield "\n"
 
 
-def captures_to_ris(rows: list[dict[str, Any]]) -> str:
-    lines: list[str] = []
+def iter_ris(rows: Iterable[dict[str, Any]]) -> Iterator[str]:
+    """
+    Yield RIS one record at a time (records separated by a blank line, with a
+    trailing newline when non-empty).
+    """
+    first = True
     for r in rows:
-        dto = build_capture_dto_from_row(r)
+        c = _citation_record(r)
 
-        title = str(dto.get("title") or "").strip()
-        url = str(dto.get("url") or "").strip()
-        doi = str(dto.get("doi") or "").strip()
-        journal = str(dto.get("container_title") or "").strip()
-
-        year_i = dto.get("year", None)
-        year_i = year_i if isinstance(year_i, int) else None
-
-        keywords = dto.get("keywords") or []
-        authors = dto.get("authors") or []
-        abstract = _norm_abstract(str(dto.get("abstract") or ""))
-
-        ty = "JOUR" if journal else "GEN"
-        lines.append(f"TY  - {ty}")
-        if title:
-            lines.append(f"TI  - {title}")
-        for a in authors:
+        ty = "JOUR" if c.journal else "GEN"
+        lines: list[str] = [f"TY  - {ty}"]
+        if c.title:
+            lines.append(f"TI  - {c.title}")
+        for a in c.authors:
             lines.append(f"AU  - {a}")
-        if journal:
-            lines.append(f"JO  - {journal}")
-        if year_i:
-            lines.append(f"PY  - {year_i}")
-        if doi:
-            lines.append(f"DO  - {doi}")
-        if url:
-            lines.append(f"UR  - {url}")
-        if abstract:
-            lines.append(f"AB  - {abstract}")
-        for kw in keywords:
+        if c.journal:
+            lines.append(f"JO  - {c.journal}")
+        if c.year:
+            lines.append(f"PY  - {c.year}")
+        if c.doi:
+            lines.append(f"DO  - {c.doi}")
+        if c.url:
+            lines.append(f"UR  - {c.url}")
+        if c.abstract:
+            lines.append(f"AB  - {c.abstract}")
+        for kw in c.keywords:
             k = str(kw).strip()
             if k:
                 lines.append(f"KW  - {k}")
         lines.append("ER  -")
-        lines.append("")
 
-    return "\n".join(lines).strip() + ("\n" if lines else "")
+        record = "\n".join(lines)
+        yield record if first else "\n\n" + record
+        first = False
+
+    if not first:
+        yield "\n"
@@ -1,13 +1,27 @@
 from __future__ import annotations
 
 import json
+import threading
+import time
 import urllib.error
 import urllib.parse
 import urllib.request
+from concurrent.futures import Future
 from typing import Any
 
 from .textutil import as_str
 
+# Process-wide Crossref cache: normalized DOI -> (fetched_at monotonic, metadata).
+# Misses (404s, timeouts) are cached as None for a short TTL, so an unresolvable
+# DOI costs one request per window while transient failures still get retried.
+_CROSSREF_TTL_S = 30 * 86400
+_CROSSREF_MISS_TTL_S = 10 * 60
+_CROSSREF_MEM_MAX = 4096
+_CROSSREF_MEM: dict[str, tuple[float, dict[str, Any] | None]] = {}
+# In-flight lookups, so concurrent callers for the same DOI share one request.
+_CROSSREF_INFLIGHT: dict[str, Future] = {}
+_CROSSREF_LOCK = threading.Lock()
+
 
 def _join_name(given: str, family: str) -> str:
     given = (given or "").strip()
@@ -30,16 +44,11 @@ def _parse_crossref_authors(message: dict[str, Any]) -> list[str]:
         if name:
             out.append(name)
 
-    # De-dupe (case-insensitive), preserve order
-    seen: set[str] = set()
-    deduped: list[str] = []
+    # De-dupe (case-insensitive), preserve order; first spelling wins.
+    first: dict[str, str] = {}
     for x in out:
-        k = x.casefold()
-        if k in seen:
-            continue
-        seen.add(k)
-        deduped.append(x)
-    return deduped
+        first.setdefault(x.casefold(), x)
+    return list(first.values())
 
 
 def _crossref_works_url(doi: str) -> str:
@@ -47,6 +56,22 @@ def _crossref_works_url(doi: str) -> str:
     return "https://api.crossref.org/works/" + urllib.parse.quote(doi, safe="")
 
 
+def _copy_meta(meta: dict[str, Any]) -> dict[str, Any]:
+    # Callers get their own dict/list so the cached entry can't be mutated.
+    out = dict(meta)
+    if isinstance(out.get("authors"), list):
+        out["authors"] = list(out["authors"])
+    return out
+
+
+def _cache_put(doi: str, meta: dict[str, Any] | None) -> None:
+    # Caller holds _CROSSREF_LOCK.
+    _CROSSREF_MEM.pop(doi, None)
+    while len(_CROSSREF_MEM) >= _CROSSREF_MEM_MAX:
+        _CROSSREF_MEM.pop(next(iter(_CROSSREF_MEM)))
+    _CROSSREF_MEM[doi] = (time.monotonic(), meta)
+
+
 def fetch_crossref_metadata(
     doi: str,
     *,
@@ -56,6 +81,10 @@ def fetch_crossref_metadata(
     """
     Best-effort Crossref lookup. Returns a small dict or None.
 
+    Successful lookups are cached in-process for _CROSSREF_TTL_S and misses for
+    _CROSSREF_MISS_TTL_S; concurrent lookups of the same DOI are coalesced into
+    a single HTTP request.
+
     Output keys (when present):
       - source: "crossref"
       - title: str
@@ -68,6 +97,42 @@ def fetch_crossref_metadata(
     if not doi:
         return None
 
+    with _CROSSREF_LOCK:
+        hit = _CROSSREF_MEM.get(doi)
+        if hit is not None:
+            fetched_at, cached = hit
+            ttl = _CROSSREF_TTL_S if cached else _CROSSREF_MISS_TTL_S
+            if time.monotonic() - fetched_at < ttl:
+                return _copy_meta(cached) if cached else None
+
+        fut = _CROSSREF_INFLIGHT.get(doi)
+        owner = fut is None
+        if fut is None:
+            fut = Future()
+            _CROSSREF_INFLIGHT[doi] = fut
+
+    if not owner:
+        shared = fut.result()
+        return _copy_meta(shared) if shared else None
+
+    meta: dict[str, Any] | None = None
+    try:
+        meta = _fetch_crossref_uncached(doi, timeout_s=timeout_s, user_agent=user_agent)
+    finally:
+        with _CROSSREF_LOCK:
+            _cache_put(doi, meta or None)
+            _CROSSREF_INFLIGHT.pop(doi, None)
+        fut.set_result(meta)
+
+    return _copy_meta(meta) if meta else None
+
+
+def _fetch_crossref_uncached(
+    doi: str,
+    *,
+    timeout_s: float,
+    user_agent: str,
+) -> dict[str, Any] | None:
     url = _crossref_works_url(doi)
     req = urllib.request.Request(
         url,
@@ -3,11 +3,21 @@ from __future__ import annotations
 import re
 from typing import Any
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
+from .metaschema import _dedupe_str_list
 from .textutil import as_str
 
+# parse_head_meta only reads <title> and <meta>; don't build the rest of the page.
+_HEAD_META_ONLY = SoupStrainer(["title", "meta"])
+
 _DOI_RX = re.compile(r"10\.\d{4,9}/[^\s<>\"']+", re.I)
+_DOI_URL_PREFIX_RX = re.compile(r"(?i)^\s*https?://(?:dx\.)?doi\.org/")
+_DOI_LABEL_PREFIX_RX = re.compile(r"(?i)^\s*doi\s*:\s*")
+_KEYWORD_SEP_RX = re.compile(r"[,\n;]+")
+_AUTHOR_SEP_RX = re.compile(r"[;\n]+")
+_AUTHOR_AND_RX = re.compile(r"\s+and\s+", re.I)
+_WS_RX = re.compile(r"\s+")
 _YEAR_RX = re.compile(r"\b(1[5-9]\d{2}|20\d{2}|21\d{2})\b")
 
 
@@ -20,7 +30,7 @@ def parse_head_meta(dom_html: str) -> tuple[dict[str, Any], str]:
     if not dom_html:
         return {}, ""
 
-    soup = BeautifulSoup(dom_html, "html.parser")
+    soup = BeautifulSoup(dom_html, "html.parser", parse_only=_HEAD_META_ONLY)
     title_tag = soup.find("title")
     title_text = title_tag.get_text(strip=True) if title_tag else ""
 
@@ -50,8 +60,8 @@ def normalize_doi(raw: Any) -> str:
     if not s:
         return ""
     s = s.replace("\u200b", "").strip()
-    s = re.sub(r"(?i)^\s*https?://(?:dx\.)?doi\.org/", "", s).strip()
-    s = re.sub(r"(?i)^\s*doi\s*:\s*", "", s).strip()
+    s = _DOI_URL_PREFIX_RX.sub("", s).strip()
+    s = _DOI_LABEL_PREFIX_RX.sub("", s).strip()
     s = s.strip().strip(".,;:)]}\"'")
 
     m = _DOI_RX.search(s)
@@ -82,34 +92,13 @@ def split_keywords(raw: Any) -> list[str]:
     if not s:
         return []
     # common separators: comma, semicolon, newline
-    parts = re.split(r"[,\n;]+", s)
-    out: list[str] = []
-    seen = set()
+    parts = _KEYWORD_SEP_RX.split(s)
+    first: dict[str, str] = {}
     for p in parts:
         k = p.strip()
-        if not k:
-            continue
-        kk = k.lower()
-        if kk in seen:
-            continue
-        seen.add(kk)
-        out.append(k)
-    return out
-
-
-def _dedupe_strs(items: list[str]) -> list[str]:
-    out: list[str] = []
-    seen: set[str] = set()
-    for it in items:
-        s = str(it or "").strip()
-        if not s:
-            continue
-        k = s.casefold()
-        if k in seen:
-            continue
-        seen.add(k)
-        out.append(s)
-    return out
+        if k:
+            first.setdefault(k.lower(), k)
+    return list(first.values())
 
 
 def split_authors(raw: Any) -> list[str]:
@@ -130,7 +119,7 @@ def split_authors(raw: Any) -> list[str]:
         parts: list[str] = []
         for v in raw:
             parts.extend(split_authors(v))
-        return _dedupe_strs(parts)
+        return _dedupe_str_list(parts)
 
     s = as_str(raw).strip()
     if not s:
@@ -138,15 +127,12 @@ def split_authors(raw: Any) -> list[str]:
 
     # Prefer clear separators
     if ";" in s or "\n" in s:
-        toks = re.split(r"[;\n]+", s)
+        toks = _AUTHOR_SEP_RX.split(s)
     else:
-        # Some sources use "A and B"
-        if re.search(r"\s+and\s+", s, flags=re.I):
-            toks = re.split(r"\s+and\s+", s, flags=re.I)
-        else:
-            toks = [s]
+        # Some sources use "A and B" (no match => [s])
+        toks = _AUTHOR_AND_RX.split(s)
 
-    return _dedupe_strs([t.strip() for t in toks])
+    return _dedupe_str_list([t.strip() for t in toks])
 
 
 def best_authors(meta: dict[str, Any]) -> list[str]:
@@ -168,7 +154,7 @@ def best_abstract(meta: dict[str, Any], *, max_chars: int = 20000) -> str:
         s = as_str(meta.get(k)).strip()
         if not s:
             continue
-        s = re.sub(r"\s+", " ", s).strip()
+        s = _WS_RX.sub(" ", s).strip()
         if len(s) > max_chars:
             s = s[:max_chars]
         return s
@@ -183,7 +169,7 @@ def html_to_text(html: str, *, max_chars: int = 400_000) -> str:
     for t in soup(["script", "style", "noscript"]):
         t.decompose()
     text = soup.get_text(" ", strip=True)
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _WS_RX.sub(" ", text).strip()
     if len(text) > max_chars:
         text = text[:max_chars]
     return text
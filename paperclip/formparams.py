@@ -28,17 +28,9 @@ def get_capture_ids(form: Mapping[str, Any]) -> list[str]:
         else:
             raw = [v]
 
-    out: list[str] = []
-    seen: set[str] = set()
-    for x in raw:
-        s = str(x or "").strip()
-        if not s:
-            continue
-        if s in seen:
-            continue
-        seen.add(s)
-        out.append(s)
-    return out
+    # dict.fromkeys de-dupes in one pass and keeps first-seen order.
+    stripped = (str(x or "").strip() for x in raw)
+    return list(dict.fromkeys(s for s in stripped if s))
 
 
 def get_collection_id(form: Mapping[str, Any]) -> int | None:
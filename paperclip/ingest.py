@@ -8,7 +8,6 @@ from typing import Any
 from .ingest_artifacts import ArtifactWriteResult, write_capture_artifacts
 from .ingest_identity import IdentityDecision, dedupe_identity
 from .ingest_parse import ParsedPayload, parse_payload
-from .ingest_upsert import IdentityDecision as UpsertIdentityDecision
 from .ingest_upsert import upsert_capture
 
 
@@ -53,12 +52,7 @@ def ingest_capture(
     final_id, created, cleanup_dirs = upsert_capture(
         db=db,
         capture_id=identity.capture_id,
-        identity=UpsertIdentityDecision(
-            capture_id=identity.capture_id,
-            created=identity.created,
-            created_at=identity.created_at,
-            cleanup_dirs=identity.cleanup_dirs,
-        ),
+        identity=identity,
         dto=parsed.dto,
         source_url=parsed.source_url,
         canon_url=parsed.canon_url,
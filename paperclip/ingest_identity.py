@@ -38,17 +38,19 @@ def dedupe_identity(
     doi = str(dto.get("doi") or "")
     cleanup_dirs: list[str] = []
 
+    # One query for both candidates (DOI match and url_hash match).
+    row_by_doi, row_by_url = ingest_repo.find_dedupe_candidates(
+        db, doi=doi, url_hash=url_hash_value
+    )
+
     # Prefer DOI match
     if doi:
-        row = ingest_repo.find_capture_by_doi(db, doi=doi)
+        row = row_by_doi
         if row:
             capture_id = row["id"]
             created_at = row["created_at"]
 
             # If there's also a url_hash match to a different capture, merge it into the DOI capture.
-            row_by_url = ingest_repo.find_capture_by_url_hash(
-                db, url_hash=url_hash_value
-            )
             if row_by_url and row_by_url["id"] != capture_id:
                 drop_id = row_by_url["id"]
                 ingest_repo.merge_duplicate_capture(
@@ -69,7 +71,7 @@ def dedupe_identity(
             )
 
     # Fall back to url_hash
-    row = ingest_repo.find_capture_by_url_hash(db, url_hash=url_hash_value)
+    row = row_by_url
     if row:
         return IdentityDecision(
             capture_id=row["id"],
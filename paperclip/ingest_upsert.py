@@ -4,34 +4,15 @@ import json
 import os
 import shutil
 import sqlite3
-from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from .constants import ALLOWED_ARTIFACTS
+from .ingest_identity import IdentityDecision
 from .repo import ingest_repo
 from .util import ensure_dir
 
 
-def _capture_rowid(db, *, capture_id: str) -> int | None:
-    """
-    Returns the SQLite INTEGER rowid for captures.id (TEXT PK).
-    Used as the stable key for capture_fts.rowid.
-    """
-    if not capture_id:
-        return None
-    try:
-        row = db.execute(
-            "SELECT rowid AS rid FROM captures WHERE id = ? LIMIT 1", (capture_id,)
-        ).fetchone()
-        if not row:
-            return None
-        rid = row["rid"]
-        return int(rid) if rid is not None else None
-    except Exception:
-        return None
-
-
 def _upsert_capture_fts(db, *, capture_id: str, title: str, content_text: str) -> None:
     """
     Maintain capture_fts (virtual FTS5 table) using captures.rowid as the key.
@@ -40,7 +21,7 @@ def _upsert_capture_fts(db, *, capture_id: str, title: str, content_text: str) -
     - FTS5 virtual tables do NOT reliably support UPSERT's "ON CONFLICT DO UPDATE".
     - "INSERT OR REPLACE" works and keeps exactly one row per rowid.
     """
-    rid = _capture_rowid(db, capture_id=capture_id)
+    rid = ingest_repo.capture_rowid(db, capture_id=capture_id)
     if rid is None:
         return
 
@@ -60,14 +41,6 @@ def _upsert_capture_fts(db, *, capture_id: str, title: str, content_text: str) -
         pass
 
 
-@dataclass(frozen=True)
-class IdentityDecision:
-    capture_id: str
-    created: bool
-    created_at: str
-    cleanup_dirs: list[str]
-
-
 def upsert_capture(
     *,
     db,
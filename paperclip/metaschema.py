@@ -21,18 +21,13 @@ def parse_meta_json(meta_json: Any) -> dict[str, Any]:
 
 
 def _dedupe_str_list(items: list[str]) -> list[str]:
-    out: list[str] = []
-    seen: set[str] = set()
+    # casefold key -> first spelling seen; dicts keep insertion order.
+    first: dict[str, str] = {}
     for it in items:
         s = str(it or "").strip()
-        if not s:
-            continue
-        k = s.casefold()
-        if k in seen:
-            continue
-        seen.add(k)
-        out.append(s)
-    return out
+        if s:
+            first.setdefault(s.casefold(), s)
+    return list(first.values())
 
 
 def _person_to_name(v: Any) -> str:
@@ -44,6 +39,11 @@ def _person_to_name(v: Any) -> str:
     if not isinstance(v, dict):
         return str(v).strip()
 
+    # CSL "literal" is an already-formatted display name; no part assembly needed.
+    literal = v.get("literal")
+    if isinstance(literal, str) and literal.strip():
+        return literal.strip()
+
     family = str(v.get("family") or v.get("last") or v.get("last_name") or "").strip()
     given = str(v.get("given") or v.get("first") or v.get("first_name") or "").strip()
     name = str(v.get("name") or "").strip()
@@ -77,7 +77,7 @@ def get_authors(meta: dict[str, Any]) -> list[str]:
     """
     Stable author list output. Accepts:
       - list[str]
-      - list[dict] (family/given/name)
+      - list[dict] (CSL literal, family/given, name)
       - str
     """
     v = meta.get("authors")
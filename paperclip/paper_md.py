@@ -3,9 +3,11 @@ from __future__ import annotations
 import re
 from typing import Any
 
+_WS_RX = re.compile(r"\s+")
+
 
 def _norm(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "").strip())
+    return _WS_RX.sub(" ", (s or "").strip())
 
 
 def _md_escape_heading(s: str) -> str:
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from urllib.parse import urlparse
 
+from bs4 import BeautifulSoup
+
 from .base import ParseResult
 from .generic import parse_generic
 from .oup import parse_oup
@@ -52,32 +54,44 @@ def _site_kind(url: str) -> str:
 
 
 def parse_article(
-    *, url: str, dom_html: str, head_meta: dict[str, object]
+    *,
+    url: str,
+    dom_html: str,
+    head_meta: dict[str, object],
+    soup: BeautifulSoup | None = None,
 ) -> ParseResult:
     """
     Site-aware parser dispatcher.
     Always returns a ParseResult. Prefer site-specific; fall back to generic.
+
+    The page is parsed once and the same (read-only) soup is shared by the
+    site-specific parser and the generic fallback; each parser detaches its own
+    copies before mutating. Callers that already hold a soup for dom_html can pass it.
     """
     kind = _site_kind(url)
+    if soup is None and dom_html.strip():
+        soup = BeautifulSoup(dom_html, "html.parser")
 
     if kind == "pmc":
-        r = parse_pmc(url=url, dom_html=dom_html, head_meta=head_meta)
+        r = parse_pmc(url=url, dom_html=dom_html, head_meta=head_meta, soup=soup)
         if r.ok and (r.article_html or r.article_text):
             return r
 
     if kind == "oup":
-        r = parse_oup(url=url, dom_html=dom_html, head_meta=head_meta)
+        r = parse_oup(url=url, dom_html=dom_html, head_meta=head_meta, soup=soup)
         if r.ok and (r.article_html or r.article_text):
             return r
 
     if kind == "wiley":
-        r = parse_wiley(url=url, dom_html=dom_html, head_meta=head_meta)
+        r = parse_wiley(url=url, dom_html=dom_html, head_meta=head_meta, soup=soup)
         if r.ok and (r.article_html or r.article_text):
             return r
 
     if kind == "sciencedirect":
-        r = parse_sciencedirect(url=url, dom_html=dom_html, head_meta=head_meta)
+        r = parse_sciencedirect(
+            url=url, dom_html=dom_html, head_meta=head_meta, soup=soup
+        )
         if r.ok and (r.article_html or r.article_text):
             return r
 
-    return parse_generic(url=url, dom_html=dom_html, head_meta=head_meta)
+    return parse_generic(url=url, dom_html=dom_html, head_meta=head_meta, soup=soup)
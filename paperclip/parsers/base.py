@@ -4,6 +4,24 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
+@dataclass(frozen=True, slots=True)
+class ReferenceItem:
+    """
+    One bibliography entry as extracted by a site parser.
+
+    Parsers keep these while building references_text and convert with to_json()
+    when storing into ParseResult.meta["references"].
+    """
+
+    text: str
+    n: str = ""
+    doi: str = ""
+    pubmed: str = ""
+
+    def to_json(self) -> dict[str, str]:
+        return {"n": self.n, "text": self.text, "doi": self.doi, "pubmed": self.pubmed}
+
+
 @dataclass(frozen=True)
 class ParseResult:
     ok: bool
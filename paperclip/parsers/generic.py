@@ -47,6 +47,10 @@ _STRIP_TAGS = {
 _REF_HEADING_RX = re.compile(
     r"^\s*(references|bibliography|works cited|literature cited|citations)\s*$", re.I
 )
+_COOKIE_CONSENT_RX = re.compile(
+    r"\b(accept|reject|manage)\b.*\b(cookie|consent)\b", re.I
+)
+_WS_RX = re.compile(r"\s+")
 
 
 def _text_len(tag: Tag) -> int:
@@ -81,9 +85,7 @@ def _detect_wall(soup: BeautifulSoup) -> tuple[str, str, list[str]]:
             reason = r
             break
 
-    if not reason and re.search(
-        r"\b(accept|reject|manage)\b.*\b(cookie|consent)\b", text, re.I
-    ):
+    if not reason and _COOKIE_CONSENT_RX.search(text):
         reason = "cookie_wall"
         hits.append("accept/reject/manage cookie")
 
@@ -132,7 +134,7 @@ def _score_candidate(tag: Tag) -> tuple[float, dict[str, float]]:
 
 def _normalize_heading_text(s: str) -> str:
     s = (s or "").strip()
-    s = re.sub(r"\s+", " ", s)
+    s = _WS_RX.sub(" ", s)
     return s
 
 
@@ -168,16 +170,15 @@ def _split_body_and_references(best_tag: Tag) -> tuple[str, str, str, str, list[
         body_text = _build_text_no_dupes(best_tag)
         return body_html, body_text, "", "", notes
 
+    # The direct child of best_tag that contains the heading: walk up from the
+    # heading instead of searching every child's subtree for it.
     split_child: Tag | None = None
-    for child in best_tag.find_all(recursive=False):
-        if not isinstance(child, Tag):
-            continue
-        try:
-            if child is ref_heading or child.find(lambda t: t is ref_heading):
-                split_child = child
-                break
-        except Exception:
-            continue
+    node: Tag | None = ref_heading
+    while isinstance(node, Tag):
+        if node.parent is best_tag:
+            split_child = node
+            break
+        node = node.parent
 
     if not split_child:
         # text-only split fallback
@@ -240,7 +241,13 @@ def _split_body_and_references(best_tag: Tag) -> tuple[str, str, str, str, list[
     return body_html, body_text, refs_html, refs_text, notes
 
 
-def parse_generic(*, url: str, dom_html: str, head_meta: dict[str, Any]) -> ParseResult:
+def parse_generic(
+    *,
+    url: str,
+    dom_html: str,
+    head_meta: dict[str, Any],
+    soup: BeautifulSoup | None = None,
+) -> ParseResult:
     if not dom_html.strip():
         return ParseResult(
             ok=False,
@@ -249,7 +256,8 @@ def parse_generic(*, url: str, dom_html: str, head_meta: dict[str, Any]) -> Pars
             notes=["empty_dom_html"],
         )
 
-    soup = BeautifulSoup(dom_html, "html.parser")
+    if soup is None:
+        soup = BeautifulSoup(dom_html, "html.parser")
     quality, blocked_reason, wall_notes = _detect_wall(soup)
 
     candidates: list[tuple[str, Tag]] = []
@@ -6,7 +6,7 @@ from typing import Any
 from bs4 import BeautifulSoup, Tag
 
 from ...htmlutil import strip_noise
-from ..base import ParseResult
+from ..base import ParseResult, ReferenceItem
 from ...sectionizer import build_sections_meta
 from .sections import oup_sections_from_html
 
@@ -66,8 +66,8 @@ def _find_references_container(soup_or_root: Tag) -> Tag | None:
     return None
 
 
-def _parse_references(refs_root: Tag) -> tuple[str, list[dict[str, str]]]:
-    items: list[dict[str, str]] = []
+def _parse_references(refs_root: Tag) -> tuple[str, list[ReferenceItem]]:
+    items: list[ReferenceItem] = []
 
     for item in refs_root.select("div.js-splitview-ref-item"):
         if not isinstance(item, Tag):
@@ -79,7 +79,7 @@ def _parse_references(refs_root: Tag) -> tuple[str, list[dict[str, str]]]:
         m = _DOI_RX.search(txt)
         if m:
             doi = m.group(0).lower()
-        items.append({"n": "", "text": txt, "doi": doi, "pubmed": ""})
+        items.append(ReferenceItem(text=txt, doi=doi))
 
     if not items:
         for rc in refs_root.select("div.ref-content"):
@@ -92,17 +92,23 @@ def _parse_references(refs_root: Tag) -> tuple[str, list[dict[str, str]]]:
             m = _DOI_RX.search(txt)
             if m:
                 doi = m.group(0).lower()
-            items.append({"n": "", "text": txt, "doi": doi, "pubmed": ""})
+            items.append(ReferenceItem(text=txt, doi=doi))
 
     lines: list[str] = ["References"] if items else []
     for it in items:
-        suffix = f" [DOI:{it['doi']}]" if it.get("doi") else ""
-        lines.append(f"{it['text']}{suffix}")
+        suffix = f" [DOI:{it.doi}]" if it.doi else ""
+        lines.append(f"{it.text}{suffix}")
 
     return "\n".join(lines).strip(), items
 
 
-def parse_oup(*, url: str, dom_html: str, head_meta: dict[str, Any]) -> ParseResult:
+def parse_oup(
+    *,
+    url: str,
+    dom_html: str,
+    head_meta: dict[str, Any],
+    soup: BeautifulSoup | None = None,
+) -> ParseResult:
     if not (dom_html or "").strip():
         return ParseResult(
             ok=False,
@@ -111,7 +117,8 @@ def parse_oup(*, url: str, dom_html: str, head_meta: dict[str, Any]) -> ParseRes
             notes=["empty_dom_html"],
         )
 
-    soup = BeautifulSoup(dom_html, "html.parser")
+    if soup is None:
+        soup = BeautifulSoup(dom_html, "html.parser")
 
     hint, fulltext0 = _find_fulltext_root(soup)
     if not isinstance(fulltext0, Tag):
@@ -150,7 +157,7 @@ def parse_oup(*, url: str, dom_html: str, head_meta: dict[str, Any]) -> ParseRes
         rr = refs_soup.find()
         if isinstance(rr, Tag):
             refs_text, items = _parse_references(rr)
-            meta["references"] = items
+            meta["references"] = [it.to_json() for it in items]
             meta["references_count"] = len(items)
         notes.append("oup_refs_extracted")
     else:
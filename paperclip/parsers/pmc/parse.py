@@ -7,13 +7,14 @@ from bs4 import BeautifulSoup, Tag
 
 from ...htmlutil import safe_decompose, strip_noise
 from ...sectionizer import build_sections_meta
-from ..base import ParseResult
+from ..base import ParseResult, ReferenceItem
 from .sections import pmc_sections_from_html
 
 _REF_HEADING_RX = re.compile(
     r"^\s*(references|bibliography|works cited|literature cited)\s*$", re.I
 )
 _DOI_RX = re.compile(r"10\.\d{4,9}/[^\s<>\"']+", re.I)
+_WS_RX = re.compile(r"\s+")
 
 _STRIP_TAGS = {
     "script",
@@ -35,7 +36,7 @@ _MEDIA_TAGS = {"figure", "video", "audio", "source", "track", "picture"}
 
 def _normalize(s: str) -> str:
     s = (s or "").strip()
-    s = re.sub(r"\s+", " ", s)
+    s = _WS_RX.sub(" ", s)
     return s
 
 
@@ -161,8 +162,8 @@ def _extract_pubmed(li: Tag) -> str:
     return ""
 
 
-def _parse_references(refs_section: Tag) -> tuple[str, list[dict[str, str]]]:
-    items: list[dict[str, str]] = []
+def _parse_references(refs_section: Tag) -> tuple[str, list[ReferenceItem]]:
+    items: list[ReferenceItem] = []
 
     list_root = refs_section.select_one("ol.ref-list") or refs_section.select_one(
         "ul.ref-list"
@@ -182,7 +183,7 @@ def _parse_references(refs_section: Tag) -> tuple[str, list[dict[str, str]]]:
         n = _ref_number(li)
         doi = _extract_doi(li)
         pubmed = _extract_pubmed(li)
-        items.append({"n": n, "text": text, "doi": doi, "pubmed": pubmed})
+        items.append(ReferenceItem(text=text, n=n, doi=doi, pubmed=pubmed))
 
     heading = ""
     h = refs_section.find(["h1", "h2", "h3", "h4"])
@@ -195,16 +196,16 @@ def _parse_references(refs_section: Tag) -> tuple[str, list[dict[str, str]]]:
 
     for it in items:
         extra: list[str] = []
-        if it.get("doi"):
-            extra.append(f"DOI:{it['doi']}")
-        if it.get("pubmed"):
-            extra.append(f"PubMed:{it['pubmed']}")
+        if it.doi:
+            extra.append(f"DOI:{it.doi}")
+        if it.pubmed:
+            extra.append(f"PubMed:{it.pubmed}")
         suffix = f" [{' · '.join(extra)}]" if extra else ""
 
-        if it.get("n"):
-            lines.append(f"{it['n']}. {it['text']}{suffix}")
+        if it.n:
+            lines.append(f"{it.n}. {it.text}{suffix}")
         else:
-            lines.append(f"{it['text']}{suffix}")
+            lines.append(f"{it.text}{suffix}")
 
     return "\n".join(lines).strip(), items
 
@@ -230,7 +231,13 @@ def _remove_subtree(t: Tag) -> None:
     safe_decompose(t)
 
 
-def parse_pmc(*, url: str, dom_html: str, head_meta: dict[str, Any]) -> ParseResult:
+def parse_pmc(
+    *,
+    url: str,
+    dom_html: str,
+    head_meta: dict[str, Any],
+    soup: BeautifulSoup | None = None,
+) -> ParseResult:
     if not dom_html.strip():
         return ParseResult(
             ok=False,
@@ -239,7 +246,8 @@ def parse_pmc(*, url: str, dom_html: str, head_meta: dict[str, Any]) -> ParseRes
             notes=["empty_dom_html"],
         )
 
-    soup = BeautifulSoup(dom_html, "html.parser")
+    if soup is None:
+        soup = BeautifulSoup(dom_html, "html.parser")
     hint, ac0, body0 = _find_roots(soup)
     if not isinstance(ac0, Tag):
         return ParseResult(
@@ -288,7 +296,7 @@ def parse_pmc(*, url: str, dom_html: str, head_meta: dict[str, Any]) -> ParseRes
         refs_root = refs_soup.find()
         if isinstance(refs_root, Tag):
             refs_text, items = _parse_references(refs_root)
-            meta["references"] = items
+            meta["references"] = [it.to_json() for it in items]
             meta["references_count"] = len(items)
         notes.append("pmc_refs_extracted")
     else:
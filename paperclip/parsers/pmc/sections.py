@@ -10,10 +10,11 @@ from ...sectionizer import _split_heading_number, classify_heading, kinds_for_ki
 _PMC_REF_SECTION_IDS = ("ref-list", "references", "bib")
 _PMC_SKIP_CONTAINER_TAGS = {"footer"}
 _KEYWORDS_SECTION_CLASS = "kwd-group"
+_WS_RX = re.compile(r"\s+")
 
 
 def _norm_space(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "").strip())
+    return _WS_RX.sub(" ", (s or "").strip())
 
 
 def _pmc_heading_for_section(sec: Tag) -> tuple[int, str]:
@@ -114,11 +115,12 @@ def pmc_sections_from_html(body_root: Tag) -> list[dict[str, Any]]:
     # ------------------------------------------------------------
     # Pass 1: walk only *direct children* to capture loose body <p>
     # ------------------------------------------------------------
+    # Every append below is guarded, so body_buf only ever holds non-empty text.
     body_buf: list[str] = []
 
     def flush_body() -> None:
         nonlocal body_buf
-        text = "\n".join([x for x in body_buf if x.strip()]).strip()
+        text = "\n".join(body_buf).strip()
         if text:
             append_section(title="Body", kind="other", level=2, text=text)
         body_buf = []
@@ -7,7 +7,7 @@ from bs4 import BeautifulSoup, Tag
 
 from ...htmlutil import strip_noise
 from ...sectionizer import build_sections_meta
-from ..base import ParseResult
+from ..base import ParseResult, ReferenceItem
 from .sections import sciencedirect_sections_from_html
 
 _REF_HEADING_RX = re.compile(
@@ -95,8 +95,8 @@ def _find_references_container(article: Tag) -> Tag | None:
     return None
 
 
-def _extract_references(ref_root: Tag) -> tuple[str, str, list[dict[str, str]]]:
-    items: list[dict[str, str]] = []
+def _extract_references(ref_root: Tag) -> tuple[str, str, list[ReferenceItem]]:
+    items: list[ReferenceItem] = []
 
     lis = ref_root.select("ol.references > li")
     if not lis:
@@ -112,7 +112,7 @@ def _extract_references(ref_root: Tag) -> tuple[str, str, list[dict[str, str]]]:
         m = _DOI_RX.search(txt)
         if m:
             doi = m.group(0).lower()
-        items.append({"n": "", "text": txt, "doi": doi, "pubmed": ""})
+        items.append(ReferenceItem(text=txt, doi=doi))
 
     refs_html = '<div data-paperclip="references">' + str(ref_root) + "</div>"
 
@@ -120,8 +120,8 @@ def _extract_references(ref_root: Tag) -> tuple[str, str, list[dict[str, str]]]:
     if items:
         lines.append("References")
         for it in items:
-            suffix = f" [DOI:{it['doi']}]" if it.get("doi") else ""
-            lines.append(f"{it['text']}{suffix}")
+            suffix = f" [DOI:{it.doi}]" if it.doi else ""
+            lines.append(f"{it.text}{suffix}")
     refs_text = "\n".join(lines).strip()
 
     return refs_html, refs_text, items
@@ -258,7 +258,11 @@ def _content_root_for_sections(article: Tag) -> Tag:
 
 
 def parse_sciencedirect(
-    *, url: str, dom_html: str, head_meta: dict[str, Any]
+    *,
+    url: str,
+    dom_html: str,
+    head_meta: dict[str, Any],
+    soup: BeautifulSoup | None = None,
 ) -> ParseResult:
     if not dom_html.strip():
         return ParseResult(
@@ -268,7 +272,8 @@ def parse_sciencedirect(
             notes=["empty_dom_html"],
         )
 
-    soup = BeautifulSoup(dom_html, "html.parser")
+    if soup is None:
+        soup = BeautifulSoup(dom_html, "html.parser")
     hint, article0 = _find_article_root(soup)
     if not isinstance(article0, Tag):
         return ParseResult(
@@ -315,7 +320,7 @@ def parse_sciencedirect(
     if isinstance(refs_tag, Tag):
         refs_html, refs_text, ref_items = _extract_references(refs_tag)
         if ref_items:
-            meta["references"] = ref_items
+            meta["references"] = [it.to_json() for it in ref_items]
             meta["references_count"] = len(ref_items)
             notes.append("sciencedirect_refs_extracted")
         else:
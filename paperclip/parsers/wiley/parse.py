@@ -6,7 +6,7 @@ from typing import Any
 from bs4 import BeautifulSoup, Tag
 
 from ...htmlutil import strip_noise
-from ..base import ParseResult
+from ..base import ParseResult, ReferenceItem
 from .sections import wiley_sections_from_html
 
 _DOI_RX = re.compile(r"10\.\d{4,9}/[^\s<>\"']+", re.I)
@@ -50,47 +50,54 @@ def _find_article_root(soup: BeautifulSoup) -> tuple[str, Tag | None]:
     return "selector:none", None
 
 
-def _extract_doi_from_ref_li(li: Tag) -> str:
+def _extract_doi_from_ref_li(li: Tag, text: str) -> str:
     doi_span = li.select_one("span.hidden.data-doi")
     if isinstance(doi_span, Tag):
         s = _norm_space(doi_span.get_text(" ", strip=True))
         if s:
             return s.lower()
 
-    t = li.get_text(" ", strip=True) or ""
-    m = _DOI_RX.search(t)
+    # `text` is the item's already-extracted text; scan it rather than walking
+    # the <li> subtree a second time.
+    m = _DOI_RX.search(text)
     if m:
         return m.group(0).lower()
     return ""
 
 
-def _parse_references(article: Tag) -> tuple[str, str, list[dict[str, str]]]:
+def _parse_references(article: Tag) -> tuple[str, str, list[ReferenceItem]]:
     refs_root = article.select_one("section.article-section__references")
     if not isinstance(refs_root, Tag):
         return "", "", []
 
-    items: list[dict[str, str]] = []
+    items: list[ReferenceItem] = []
     for li in refs_root.select("li[data-bib-id]"):
         if not isinstance(li, Tag):
             continue
         txt = _norm_space(li.get_text(" ", strip=True))
         if not txt:
             continue
-        doi = _extract_doi_from_ref_li(li)
-        items.append({"n": "", "text": txt, "doi": doi, "pubmed": ""})
+        doi = _extract_doi_from_ref_li(li, txt)
+        items.append(ReferenceItem(text=txt, doi=doi))
 
     refs_html = '<div data-paperclip="references">' + str(refs_root) + "</div>"
 
     lines: list[str] = ["References"] if items else []
     for it in items:
-        suffix = f" [DOI:{it['doi']}]" if it.get("doi") else ""
-        lines.append(f"{it['text']}{suffix}")
+        suffix = f" [DOI:{it.doi}]" if it.doi else ""
+        lines.append(f"{it.text}{suffix}")
     refs_text = "\n".join(lines).strip()
 
     return refs_html, refs_text, items
 
 
-def parse_wiley(*, url: str, dom_html: str, head_meta: dict[str, Any]) -> ParseResult:
+def parse_wiley(
+    *,
+    url: str,
+    dom_html: str,
+    head_meta: dict[str, Any],
+    soup: BeautifulSoup | None = None,
+) -> ParseResult:
     if not (dom_html or "").strip():
         return ParseResult(
             ok=False,
@@ -99,7 +106,8 @@ def parse_wiley(*, url: str, dom_html: str, head_meta: dict[str, Any]) -> ParseR
             notes=["empty_dom_html"],
         )
 
-    soup = BeautifulSoup(dom_html, "html.parser")
+    if soup is None:
+        soup = BeautifulSoup(dom_html, "html.parser")
     hint, art0 = _find_article_root(soup)
     if not isinstance(art0, Tag):
         return ParseResult(
@@ -130,7 +138,7 @@ def parse_wiley(*, url: str, dom_html: str, head_meta: dict[str, Any]) -> ParseR
     # References (use original art0 so we don't lose anything from stripping)
     refs_html, refs_text, ref_items = _parse_references(art0)
     if ref_items:
-        meta["references"] = ref_items
+        meta["references"] = [it.to_json() for it in ref_items]
         meta["references_count"] = len(ref_items)
         notes.append("wiley_refs_extracted")
     else:
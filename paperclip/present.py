@@ -5,23 +5,18 @@ from typing import Any, Iterable
 
 from . import artifacts
 from .capture_dto import build_capture_dto_from_row
-from .citation import citation_fields_from_meta
+from .citation import citation_fields_from_parts
 
 
-def present_capture_for_library(cap: dict[str, Any]) -> dict[str, Any]:
-    """
-    Adds derived citation display fields for templates.
-
-    IMPORTANT:
-    This function must NOT mutate the input dict, because the same row dict may be
-    reused (e.g., API route builds rows_html and JSON captures from the same list).
-    """
-    cap2 = dict(cap)
+def _citation(dto: dict[str, Any]) -> dict[str, str]:
+    # The DTO already walked meta_record for authors/abstract; reuse that pass.
+    return citation_fields_from_parts(
+        authors=dto.get("authors") or [], abstract=dto.get("abstract") or ""
+    )
 
-    dto = build_capture_dto_from_row(cap2)
-    meta = dto["meta_record"]
-    citation = citation_fields_from_meta(meta)
 
+def _library_row(cap: dict[str, Any], citation: dict[str, str]) -> dict[str, Any]:
+    cap2 = dict(cap)
     cap2["authors_str"] = citation.get("authors_str") or ""
     cap2["authors_short"] = citation.get("authors_short") or ""
     cap2["abstract_snip"] = citation.get("abstract_snip") or ""
@@ -31,13 +26,7 @@ def present_capture_for_library(cap: dict[str, Any]) -> dict[str, Any]:
     return cap2
 
 
-def present_capture_for_api(cap: dict[str, Any]) -> dict[str, Any]:
-    """
-    Produces the stable API shape for library rows.
-    """
-    dto = build_capture_dto_from_row(cap)
-    citation = citation_fields_from_meta(dto["meta_record"])
-
+def _api_row(dto: dict[str, Any], citation: dict[str, str]) -> dict[str, Any]:
     return {
         "id": dto.get("id"),
         "title": dto.get("title"),
@@ -50,6 +39,31 @@ def present_capture_for_api(cap: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+def present_capture_for_library(cap: dict[str, Any]) -> dict[str, Any]:
+    """
+    Adds derived citation display fields for templates.
+
+    IMPORTANT:
+    This function must NOT mutate the input dict, because the same row dict may be
+    reused (e.g., API route builds rows_html and JSON captures from the same list).
+    """
+    dto = build_capture_dto_from_row(cap)
+    return _library_row(cap, _citation(dto))
+
+
+def present_capture_for_library_and_api(
+    cap: dict[str, Any],
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """
+    Returns (library_row, api_row) from a single DTO/citation build: the
+    present_capture_for_library row plus the stable API shape for library rows.
+    Does not mutate cap.
+    """
+    dto = build_capture_dto_from_row(cap)
+    citation = _citation(dto)
+    return _library_row(cap, citation), _api_row(dto, citation)
+
+
 def present_capture_detail(
     *,
     db,
@@ -77,7 +91,7 @@ def present_capture_detail(
 
     dto = build_capture_dto_from_row(capture_row)
     meta = dto["meta_record"]
-    citation = citation_fields_from_meta(meta)
+    citation = _citation(dto)
 
     capture = {
         "id": dto.get("id") or capture_id,
@@ -21,11 +21,21 @@ def get_q_arg(args: Mapping[str, Any]) -> str:
     return (str(args.get("q") or "")).strip()
 
 
+# Upper bound for ?page=: keeps LIMIT/OFFSET inside SQLite's integer range and
+# stops absurd offsets from turning into full-table scans.
+MAX_PAGE = 100_000
+
+
 def get_page_arg(args: Mapping[str, Any], default: int = 1) -> int:
     p = safe_int(args.get("page"))
     if p is None:
         p = default
-    return max(1, int(p))
+    return min(MAX_PAGE, max(1, int(p)))
+
+
+def get_after_arg(args: Mapping[str, Any]) -> str:
+    """Keyset cursor for /api/library/ (?after=<updated_at>_<id>); may be empty."""
+    return (str(args.get("after") or "")).strip()
 
 
 def get_page_size_arg(args: Mapping[str, Any], default: int = 50) -> int:
@@ -38,6 +48,7 @@ class LibraryParams:
     selected_col: str
     page: int
     page_size: int
+    after: str = ""
 
 
 def library_params_from_args(
@@ -48,4 +59,5 @@ def library_params_from_args(
         selected_col=get_collection_arg(args),
         page=get_page_arg(args, default=1),
         page_size=get_page_size_arg(args, default=default_page_size),
+        after=get_after_arg(args),
     )
@@ -1,15 +1,40 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Iterator
 
 from ..db import rows_to_dicts
 
+# Ids per "IN (?, ...)" statement: stays under SQLITE_MAX_VARIABLE_NUMBER (999 on
+# older builds) with room for the statement's other parameters.
+_IN_CHUNK = 500
+
+
+def _chunks(ids: list[str]) -> Iterator[list[str]]:
+    for i in range(0, len(ids), _IN_CHUNK):
+        yield ids[i : i + _IN_CHUNK]
+
 
 def get_capture(db, capture_id: str) -> dict[str, Any] | None:
     row = db.execute("SELECT * FROM captures WHERE id = ?", (capture_id,)).fetchone()
     return dict(row) if row else None
 
 
+def get_capture_for_detail(db, capture_id: str) -> dict[str, Any] | None:
+    """
+    get_capture narrowed to the columns the detail page renders (skips url_canon,
+    url_hash and timestamps).
+    """
+    row = db.execute(
+        """
+        SELECT id, title, url, doi, year, container_title, meta_json
+        FROM captures
+        WHERE id = ?
+        """,
+        (capture_id,),
+    ).fetchone()
+    return dict(row) if row else None
+
+
 def list_existing_capture_ids(db, *, capture_ids: list[str]) -> list[str]:
     """
     Return only capture ids that exist in the DB (preserves input order).
@@ -18,12 +43,14 @@ def list_existing_capture_ids(db, *, capture_ids: list[str]) -> list[str]:
     if not ids:
         return []
 
-    qmarks = ",".join(["?"] * len(ids))
-    rows = db.execute(
-        f"SELECT id FROM captures WHERE id IN ({qmarks})",
-        tuple(ids),
-    ).fetchall()
-    present = {str(r["id"]) for r in rows}
+    present: set[str] = set()
+    for chunk in _chunks(ids):
+        qmarks = ",".join(["?"] * len(chunk))
+        rows = db.execute(
+            f"SELECT id FROM captures WHERE id IN ({qmarks})",
+            tuple(chunk),
+        ).fetchall()
+        present.update(str(r["id"]) for r in rows)
 
     out: list[str] = []
     for cid in ids:
@@ -77,15 +104,16 @@ def set_capture_collections(
     to_add = sorted(selected_ids - cur_ids)
     to_remove = sorted(cur_ids - selected_ids)
 
-    for cid in to_add:
-        db.execute(
+    # One executemany per direction instead of a statement per collection.
+    if to_add:
+        db.executemany(
             "INSERT OR IGNORE INTO collection_items(collection_id, capture_id, added_at) VALUES(?, ?, ?)",
-            (cid, capture_id, now),
+            [(cid, capture_id, now) for cid in to_add],
         )
-    for cid in to_remove:
-        db.execute(
+    if to_remove:
+        db.executemany(
             "DELETE FROM collection_items WHERE collection_id = ? AND capture_id = ?",
-            (cid, capture_id),
+            [(cid, capture_id) for cid in to_remove],
         )
 
     db.execute(
@@ -94,40 +122,40 @@ def set_capture_collections(
     )
 
 
-def _rowid_for_id(db, capture_id: str) -> int | None:
-    try:
-        row = db.execute(
-            "SELECT rowid AS rid FROM captures WHERE id = ? LIMIT 1", (capture_id,)
-        ).fetchone()
-        if not row:
-            return None
-        rid = row["rid"]
-        return int(rid) if rid is not None else None
-    except Exception:
-        return None
-
-
 def delete_captures(db, *, capture_ids: list[str], fts_enabled: bool) -> int:
     """
     Delete captures and related rows. Does NOT commit.
     We explicitly delete from capture_fts because it's a virtual table.
     Returns number of capture rows deleted (best effort).
+
+    One statement per table per chunk of _IN_CHUNK ids (not per capture).
     """
-    deleted = 0
-    for cid in capture_ids:
-        # Compute rowid before deleting captures row (needed to delete FTS row)
-        rid = _rowid_for_id(db, cid) if fts_enabled else None
+    ids = list(dict.fromkeys(str(c) for c in (capture_ids or []) if c))
+    if not ids:
+        return 0
 
-        db.execute("DELETE FROM collection_items WHERE capture_id = ?", (cid,))
-        db.execute("DELETE FROM capture_text WHERE capture_id = ?", (cid,))
+    deleted = 0
+    for chunk in _chunks(ids):
+        qmarks = ",".join(["?"] * len(chunk))
+        params = tuple(chunk)
 
-        if fts_enabled and rid is not None:
+        # FTS rows are keyed by captures.rowid, so drop them before the captures rows.
+        if fts_enabled:
             try:
-                db.execute("DELETE FROM capture_fts WHERE rowid = ?", (rid,))
+                db.execute(
+                    "DELETE FROM capture_fts WHERE rowid IN "
+                    f"(SELECT rowid FROM captures WHERE id IN ({qmarks}))",
+                    params,
+                )
             except Exception:
                 pass
 
-        cur = db.execute("DELETE FROM captures WHERE id = ?", (cid,))
+        db.execute(
+            f"DELETE FROM collection_items WHERE capture_id IN ({qmarks})", params
+        )
+        db.execute(f"DELETE FROM capture_text WHERE capture_id IN ({qmarks})", params)
+
+        cur = db.execute(f"DELETE FROM captures WHERE id IN ({qmarks})", params)
         try:
             deleted += int(cur.rowcount or 0)
         except Exception:
@@ -135,6 +163,15 @@ def delete_captures(db, *, capture_ids: list[str], fts_enabled: bool) -> int:
     return deleted
 
 
+def _touch_captures(db, *, capture_ids: list[str], now: str) -> None:
+    for chunk in _chunks(capture_ids):
+        qmarks = ",".join(["?"] * len(chunk))
+        db.execute(
+            f"UPDATE captures SET updated_at = ? WHERE id IN ({qmarks})",
+            (now, *chunk),
+        )
+
+
 def bulk_add_to_collection(
     db,
     *,
@@ -146,17 +183,19 @@ def bulk_add_to_collection(
     Add each capture to a collection and bump updated_at. Does NOT commit.
     Returns number of new memberships created (INSERT OR IGNORE rowcount sum).
     """
-    added = 0
-    for cid in capture_ids:
-        cur = db.execute(
-            "INSERT OR IGNORE INTO collection_items(collection_id, capture_id, added_at) VALUES(?, ?, ?)",
-            (collection_id, cid, now),
-        )
-        try:
-            added += int(cur.rowcount or 0)
-        except Exception:
-            pass
-        db.execute("UPDATE captures SET updated_at = ? WHERE id = ?", (now, cid))
+    ids = list(dict.fromkeys(capture_ids or []))
+    if not ids:
+        return 0
+
+    cur = db.executemany(
+        "INSERT OR IGNORE INTO collection_items(collection_id, capture_id, added_at) VALUES(?, ?, ?)",
+        [(collection_id, cid, now) for cid in ids],
+    )
+    try:
+        added = int(cur.rowcount or 0)
+    except Exception:
+        added = 0
+    _touch_captures(db, capture_ids=ids, now=now)
     return added
 
 
@@ -171,15 +210,20 @@ def bulk_remove_from_collection(
     Remove each capture from a collection and bump updated_at. Does NOT commit.
     Returns number of memberships removed (DELETE rowcount sum).
     """
+    ids = list(dict.fromkeys(capture_ids or []))
+    if not ids:
+        return 0
+
     removed = 0
-    for cid in capture_ids:
+    for chunk in _chunks(ids):
+        qmarks = ",".join(["?"] * len(chunk))
         cur = db.execute(
-            "DELETE FROM collection_items WHERE collection_id = ? AND capture_id = ?",
-            (collection_id, cid),
+            f"DELETE FROM collection_items WHERE collection_id = ? AND capture_id IN ({qmarks})",
+            (collection_id, *chunk),
         )
         try:
             removed += int(cur.rowcount or 0)
         except Exception:
             pass
-        db.execute("UPDATE captures SET updated_at = ? WHERE id = ?", (now, cid))
+    _touch_captures(db, capture_ids=ids, now=now)
     return removed
@@ -6,11 +6,10 @@ from ..db import rows_to_dicts
 
 
 def list_collections_with_counts(db) -> list[dict[str, Any]]:
+    # item_count is trigger-maintained (see db.COLLECTION_COUNT_TRIGGERS_SQL).
     rows = db.execute("""
-        SELECT c.id, c.name, COUNT(ci.capture_id) AS count
+        SELECT c.id, c.name, c.item_count AS count
         FROM collections c
-        LEFT JOIN collection_items ci ON ci.collection_id = c.id
-        GROUP BY c.id
         ORDER BY c.name COLLATE NOCASE ASC
         """).fetchall()
     return rows_to_dicts(rows)
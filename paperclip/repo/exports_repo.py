@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-from typing import Any
-
-from ..db import rows_to_dicts
+from typing import Any, Iterator
 
 
 def get_collection_name(db, *, collection_id: int) -> str | None:
@@ -15,36 +13,100 @@ def get_collection_name(db, *, collection_id: int) -> str | None:
     return str(name) if name else None
 
 
-def get_capture_by_id(db, *, capture_id: str) -> dict[str, Any] | None:
-    row = db.execute("SELECT * FROM captures WHERE id = ?", (capture_id,)).fetchone()
+# Columns export renderers read (citation fields, meta_json for authors/abstract/
+# keywords, timestamps for bundle fallbacks); skips url_canon/url_hash.
+_EXPORT_COLS = (
+    "cap.id, cap.title, cap.url, cap.doi, cap.year, cap.container_title, "
+    "cap.meta_json, cap.created_at, cap.updated_at"
+)
+
+# BibTeX/RIS only read authors/abstract/keywords from meta_json; project those in
+# SQL so the stored head-<meta> dump isn't shipped/decoded per row.
+_CITATION_EXPORT_COLS = (
+    "cap.id, cap.title, cap.url, cap.doi, cap.year, cap.container_title, "
+    "CASE WHEN json_valid(cap.meta_json) THEN json_object("
+    "'authors', json_extract(cap.meta_json, '$.authors'), "
+    "'abstract', json_extract(cap.meta_json, '$.abstract'), "
+    "'keywords', json_extract(cap.meta_json, '$.keywords')"
+    ") ELSE '{}' END AS meta_json, "
+    "cap.created_at, cap.updated_at"
+)
+
+
+def _cols(citation_only: bool) -> str:
+    return _CITATION_EXPORT_COLS if citation_only else _EXPORT_COLS
+
+
+def get_capture_by_id(
+    db, *, capture_id: str, citation_only: bool = False
+) -> dict[str, Any] | None:
+    row = db.execute(
+        f"SELECT {_cols(citation_only)} FROM captures cap WHERE cap.id = ?",
+        (capture_id,),
+    ).fetchone()
     return dict(row) if row else None
 
 
-def list_all_captures(db) -> list[dict[str, Any]]:
-    rows = db.execute("SELECT * FROM captures ORDER BY updated_at DESC").fetchall()
-    return rows_to_dicts(rows)
+def _all_captures_sql(cols: str) -> str:
+    return f"SELECT {cols} FROM captures cap ORDER BY cap.updated_at DESC"
 
 
-def list_captures_in_collection(db, *, collection_id: int) -> list[dict[str, Any]]:
-    rows = db.execute(
-        """
-        SELECT cap.*
+def _collection_captures_sql(cols: str) -> str:
+    return f"""
+        SELECT {cols}
         FROM captures cap
         JOIN collection_items ci ON ci.capture_id = cap.id
         WHERE ci.collection_id = ?
         ORDER BY cap.updated_at DESC
-        """,
+    """
+
+
+def _iter_dicts(cur) -> Iterator[dict[str, Any]]:
+    # Step the cursor row by row instead of fetchall(): peak memory stays at one row.
+    for r in cur:
+        yield dict(r)
+
+
+def iter_all_captures(db, *, citation_only: bool = False) -> Iterator[dict[str, Any]]:
+    """
+    All captures, newest first, as a cursor-backed iterator; the connection
+    must stay open while iterating. citation_only=True narrows meta_json to
+    authors/abstract/keywords.
+    """
+    return _iter_dicts(db.execute(_all_captures_sql(_cols(citation_only))))
+
+
+def count_all_captures(db) -> int:
+    row = db.execute("SELECT COUNT(1) AS n FROM captures").fetchone()
+    return int(row["n"])
+
+
+def iter_captures_in_collection(
+    db, *, collection_id: int, citation_only: bool = False
+) -> Iterator[dict[str, Any]]:
+    """Captures in a collection, newest first; see iter_all_captures."""
+    sql = _collection_captures_sql(_cols(citation_only))
+    return _iter_dicts(db.execute(sql, (collection_id,)))
+
+
+def count_captures_in_collection(db, *, collection_id: int) -> int:
+    row = db.execute(
+        "SELECT COUNT(1) AS n FROM collection_items WHERE collection_id = ?",
         (collection_id,),
-    ).fetchall()
-    return rows_to_dicts(rows)
+    ).fetchone()
+    return int(row["n"])
+
+
+def _captures_by_ids_sql(n: int, cols: str = _EXPORT_COLS) -> str:
+    qmarks = ",".join(["?"] * n)
+    return f"SELECT {cols} FROM captures cap WHERE cap.id IN ({qmarks})"
 
 
-def select_captures_by_ids(db, *, capture_ids: list[str]) -> list[dict[str, Any]]:
+def iter_captures_by_ids(
+    db, *, capture_ids: list[str], citation_only: bool = False
+) -> Iterator[dict[str, Any]]:
+    """Captures with the given ids (unordered); see iter_all_captures."""
     if not capture_ids:
-        return []
-    qmarks = ",".join(["?"] * len(capture_ids))
-    rows = db.execute(
-        f"SELECT * FROM captures WHERE id IN ({qmarks})",
-        tuple(capture_ids),
-    ).fetchall()
-    return rows_to_dicts(rows)
+        return iter(())
+    sql = _captures_by_ids_sql(len(capture_ids), _cols(citation_only))
+    return _iter_dicts(db.execute(sql, tuple(capture_ids)))
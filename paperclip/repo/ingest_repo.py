@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Any
+
 
 def find_capture_by_doi(db, *, doi: str):
     if not doi:
@@ -19,7 +21,42 @@ def find_capture_by_url_hash(db, *, url_hash: str):
     ).fetchone()
 
 
-def _rowid_for_id(db, capture_id: str) -> int | None:
+def find_dedupe_candidates(db, *, doi: str, url_hash: str) -> tuple[Any, Any]:
+    """
+    Fetch the DOI match and the url_hash match in one round trip.
+
+    Returns (row_by_doi, row_by_url_hash); either may be None. Rows carry
+    id and created_at like find_capture_by_doi / find_capture_by_url_hash.
+    """
+    if not doi and not url_hash:
+        return None, None
+
+    rows = db.execute(
+        """
+        SELECT id, created_at, doi, url_hash
+        FROM captures
+        WHERE (doi = ? AND doi <> '') OR url_hash = ?
+        """,
+        (doi or "", url_hash or ""),
+    ).fetchall()
+
+    by_doi = None
+    by_url = None
+    for r in rows:
+        if by_doi is None and doi and r["doi"] == doi:
+            by_doi = r
+        if by_url is None and url_hash and r["url_hash"] == url_hash:
+            by_url = r
+    return by_doi, by_url
+
+
+def capture_rowid(db, *, capture_id: str) -> int | None:
+    """
+    Returns the SQLite INTEGER rowid for captures.id (TEXT PK).
+    Used as the stable key for capture_fts.rowid.
+    """
+    if not capture_id:
+        return None
     try:
         row = db.execute(
             "SELECT rowid AS rid FROM captures WHERE id = ? LIMIT 1", (capture_id,)
@@ -46,20 +83,17 @@ def merge_duplicate_capture(
     if not keep_id or not drop_id or keep_id == drop_id:
         return
 
-    rows = db.execute(
-        "SELECT collection_id, added_at FROM collection_items WHERE capture_id = ?",
-        (drop_id,),
-    ).fetchall()
-
-    for r in rows:
-        db.execute(
-            "INSERT OR IGNORE INTO collection_items (collection_id, capture_id, added_at) VALUES (?, ?, ?)",
-            (r["collection_id"], keep_id, r["added_at"]),
-        )
+    db.execute(
+        """
+        INSERT OR IGNORE INTO collection_items (collection_id, capture_id, added_at)
+        SELECT collection_id, ?, added_at FROM collection_items WHERE capture_id = ?
+        """,
+        (keep_id, drop_id),
+    )
 
     if fts_enabled:
         try:
-            rid = _rowid_for_id(db, drop_id)
+            rid = capture_rowid(db, capture_id=drop_id)
             if rid is not None:
                 db.execute("DELETE FROM capture_fts WHERE rowid = ?", (rid,))
         except Exception:
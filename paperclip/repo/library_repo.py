@@ -7,6 +7,18 @@ from typing import Any
 from ..db import rows_to_dicts
 from ..parseutil import safe_int
 
+# Library rows only render authors + abstract from meta_json; the stored blob also
+# carries every head <meta> tag and parse diagnostics. Project just those two keys
+# in SQL so list pages don't ship/decode the rest (same shape for parse_meta_json).
+_LIST_META_JSON_SQL = (
+    "CASE WHEN json_valid(cap.meta_json) THEN json_object("
+    "'authors', json_extract(cap.meta_json, '$.authors'), "
+    "'abstract', json_extract(cap.meta_json, '$.abstract')"
+    ") ELSE '{}' END AS meta_json"
+)
+
+_FTS_TOKEN_RX = re.compile(r"[a-z0-9]+")
+
 
 def count_all_captures(db) -> int:
     row = db.execute("SELECT COUNT(1) AS n FROM captures").fetchone()
@@ -16,13 +28,33 @@ def count_all_captures(db) -> int:
 def _fts_query(q: str) -> str:
     """Conservative FTS5 query builder to avoid syntax errors."""
     q = (q or "").strip().lower()
-    toks = re.findall(r"[a-z0-9]+", q)
+    toks = _FTS_TOKEN_RX.findall(q)
     toks = [t for t in toks if t][:10]
     if not toks:
         return ""
     return " ".join(f"{t}*" for t in toks)
 
 
+def encode_cursor(updated_at: str, capture_id: str) -> str:
+    """Keyset cursor for the (updated_at DESC, id DESC) library ordering."""
+    return f"{updated_at}_{capture_id}"
+
+
+def decode_cursor(after: str) -> tuple[str, str] | None:
+    """Inverse of encode_cursor; None for a missing/malformed cursor."""
+    # ISO timestamps never contain "_", so the first one is the separator.
+    ts, sep, cid = (after or "").strip().partition("_")
+    if not sep or not ts or not cid:
+        return None
+    return ts, cid
+
+
+def has_collection_filter(selected_col: str) -> bool:
+    """True if selected_col narrows results (mirrors LibraryQuery.build)."""
+    col_id = safe_int(selected_col)
+    return bool(col_id and col_id > 0)
+
+
 @dataclass
 class LibraryQuery:
     q: str = ""
@@ -84,11 +116,20 @@ def search_captures(
     page: int,
     page_size: int,
     fts_enabled: bool,
+    after: str = "",
 ) -> tuple[list[dict[str, Any]], int, bool]:
-    """Returns (captures, total, has_more)."""
+    """
+    Returns (captures, total, has_more).
+
+    With a valid `after` cursor (see encode_cursor) the page is located by a
+    keyset seek on (updated_at, id) and `page` is ignored: the page fetch is an
+    index range search instead of skipping OFFSET rows. `total` still counts
+    the whole filtered set on every call.
+    """
     page = max(1, int(page))
     page_size = max(1, int(page_size))
     offset = max(0, (page - 1) * page_size)
+    cursor = decode_cursor(after)
 
     builder = LibraryQuery(q=q, selected_col=selected_col, fts_enabled=fts_enabled)
     builder.build()
@@ -98,15 +139,29 @@ def search_captures(
         tuple(builder.params),
     ).fetchone()["n"]
 
+    select_sql = (
+        "SELECT cap.id, cap.title, cap.url, cap.doi, cap.year, cap.container_title, "
+        "cap.updated_at, " + _LIST_META_JSON_SQL + " "
+        "FROM captures cap" + builder.join_sql
+    )
+    order_sql = " ORDER BY cap.updated_at DESC, cap.id DESC"
+
+    if cursor is not None:
+        ts, cid = cursor
+        # Row-value comparison so SQLite turns it into an index range (SEARCH)
+        # on idx_captures_updated_at_id; the OR-expanded form only SCANs.
+        seek = "(cap.updated_at, cap.id) < (?, ?)"
+        where_sql = " WHERE " + " AND ".join(builder.where_parts + [seek])
+        # Fetch one extra row to learn has_more without counting past the cursor.
+        rows = db.execute(
+            select_sql + where_sql + order_sql + " LIMIT ?",
+            tuple(builder.params + [ts, cid, page_size + 1]),
+        ).fetchall()
+        captures = rows_to_dicts(rows[:page_size])
+        return captures, int(total), len(rows) > page_size
+
     rows = db.execute(
-        (
-            "SELECT cap.id, cap.title, cap.url, cap.doi, cap.year, cap.container_title, "
-            "cap.updated_at, cap.meta_json "
-            "FROM captures cap"
-            + builder.join_sql
-            + builder.where_sql
-            + " ORDER BY cap.updated_at DESC LIMIT ? OFFSET ?"
-        ),
+        select_sql + builder.where_sql + order_sql + " LIMIT ? OFFSET ?",
         tuple(builder.params + [page_size, offset]),
     ).fetchall()
 
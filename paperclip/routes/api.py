@@ -6,9 +6,11 @@ from pathlib import Path
 from flask import Flask, current_app, request
 
 from ..apiutil import api_error, api_ok
+from ..db import get_db
 from ..errors import BadRequest, InternalError, NotFound
 from ..ingest import ingest_capture
 from ..ingest_schema import validate_ingest_payload
+from ..repo import captures_repo
 from ..services.maintenance_service import rebuild_fts, verify_fts
 from ..tx import db_tx
 from ..util import rmtree_best_effort
@@ -71,17 +73,10 @@ def register(app: Flask) -> None:
 
     @app.get("/api/captures/<capture_id>/")
     def api_get_capture(capture_id: str):
-        db = current_app.extensions["paperclip_db"] if False else None  # type: ignore[unreachable]
-        # (kept import-free; get_db is in paperclip.db and imported indirectly via tx in request context)
-        from ..db import get_db  # local import to avoid circular init edge cases
-
-        db = get_db()
-        row = db.execute(
-            "SELECT * FROM captures WHERE id = ? LIMIT 1", (capture_id,)
-        ).fetchone()
+        row = captures_repo.get_capture(get_db(), capture_id)
         if not row:
             raise NotFound(code="not_found", message="Capture not found")
-        return api_ok(dict(row), status=200)
+        return api_ok(row, status=200)
 
     @app.post("/api/maintenance/rebuild-fts/")
     def api_rebuild_fts():
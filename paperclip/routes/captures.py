@@ -21,7 +21,7 @@ from ..httputil import redirect_next
 from ..services import captures_service
 from ..timeutil import utc_now_iso
 from ..tx import db_tx
-from ..util import rmtree_best_effort
+from ..util import rmtree_deferred
 
 
 def register(app: Flask) -> None:
@@ -46,9 +46,13 @@ def register(app: Flask) -> None:
             abort(404)
 
         p = artifacts.artifact_path(Path(app.config["ARTIFACTS_DIR"]), capture_id, name)
-        if not p.exists():
+        # send_file stats/opens the file itself; let a missing file surface there
+        # instead of stat-ing it twice (exists() + send_file). It also sets
+        # ETag/Last-Modified and answers If-None-Match/If-Modified-Since with 304.
+        try:
+            return send_file(p)
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
             abort(404)
-        return send_file(p)
 
     @app.post("/captures/<capture_id>/collections/set/")
     def capture_set_collections(capture_id: str):
@@ -82,8 +86,10 @@ def register(app: Flask) -> None:
                 fts_enabled=fts_enabled,
             )
 
+        # Large selections can mean many artifact trees; don't hold the response
+        # on the recursive delete.
         if res.cleanup_paths:
-            rmtree_best_effort(res.cleanup_paths)
+            rmtree_deferred(res.cleanup_paths)
 
         flash(res.message, res.category)
         return redirect_next("library")
@@ -1,17 +1,25 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Iterable
 
-from flask import Flask, Response, flash, request
+from flask import Flask, Response, flash, request, stream_with_context
 
-from ..db import get_db
+from ..db import get_db, keep_db_open_for_stream
 from ..formparams import get_capture_ids
 from ..httputil import redirect_next
 from ..services import exports_service
 
 
 def register(app: Flask) -> None:
-    def _as_download(body: str, *, mimetype: str, filename: str) -> Response:
+    def _as_download(
+        body: str | Iterable[str], *, mimetype: str, filename: str
+    ) -> Response:
+        # `body` may be an iterator; Response then streams it chunk by chunk. Keep
+        # the request context (and its DB connection) alive until it is drained.
+        if not isinstance(body, str):
+            keep_db_open_for_stream()
+            body = stream_with_context(body)
         resp = Response(body, mimetype=mimetype)
         resp.headers["Content-Disposition"] = f'attachment; filename="{filename}"'
         resp.headers["Cache-Control"] = "no-store"
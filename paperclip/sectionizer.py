@@ -25,6 +25,7 @@ _HEADING_LINE_RX = re.compile(
 
 _HEADING_BAD_END_RX = re.compile(r"[.?!]\s*$")
 _KEYWORDS_PREFIX_RX = re.compile(r"^\s*keywords?\s*:\s*(.+)\s*$", re.I)
+_WS_RX = re.compile(r"\s+")
 
 # Combined headings (common in journals)
 _RESULTS_AND_DISCUSSION_RX = re.compile(
@@ -64,7 +65,7 @@ _CANON_RULES: list[tuple[str, re.Pattern[str]]] = [
 
 
 def _norm_space(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "").strip())
+    return _WS_RX.sub(" ", (s or "").strip())
 
 
 def _split_heading_number(line: str) -> tuple[str | None, str]:
@@ -15,7 +15,7 @@ def capture_detail_context(
     artifacts_root: Path,
     allowed_artifacts: Iterable[str],
 ) -> dict | None:
-    row = captures_repo.get_capture(db, capture_id=capture_id)
+    row = captures_repo.get_capture_for_detail(db, capture_id=capture_id)
     if not row:
         return None
 
@@ -2,28 +2,75 @@ from __future__ import annotations
 
 import json
 import re
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Literal, Mapping
+from typing import Any, Callable, Iterable, Iterator, Literal, Mapping, TypeVar
 
 from ..bundle import PaperBundle
-from ..export import captures_to_bibtex, captures_to_ris
+from ..export import iter_bibtex, iter_ris
 from ..kb_schema import papers_jsonl_record
 from ..parseutil import safe_int
 from ..queryparams import get_collection_arg
 from ..repo import exports_repo
 
+# Bundle loading is a handful of small file reads per capture (I/O-bound); overlap
+# them across captures for multi-paper exports.
+_BUNDLE_IO = ThreadPoolExecutor(max_workers=8, thread_name_prefix="bundle-load")
+_BUNDLE_PREFETCH = 16
+
+_T = TypeVar("_T")
+
+_SLUG_NONALNUM_RX = re.compile(r"[^a-z0-9]+")
+
+
+def _iter_prefetched(
+    captures: Iterable[dict[str, Any]],
+    load: Callable[[str, dict[str, Any]], _T],
+) -> Iterator[tuple[str, dict[str, Any], _T]]:
+    """
+    Yield (capture_id, cap_row, load(capture_id, cap_row)) in input order, skipping
+    rows without an id. Up to _BUNDLE_PREFETCH loads run ahead on the I/O pool.
+    """
+    pending: deque[tuple[str, dict[str, Any], Future[_T]]] = deque()
+    for cap in captures:
+        cap_id = str(cap.get("id") or "").strip()
+        if not cap_id:
+            continue
+        pending.append((cap_id, cap, _BUNDLE_IO.submit(load, cap_id, cap)))
+        if len(pending) >= _BUNDLE_PREFETCH:
+            cid, row, fut = pending.popleft()
+            yield cid, row, fut.result()
+
+    while pending:
+        cid, row, fut = pending.popleft()
+        yield cid, row, fut.result()
+
+
+def _iter_bundles(
+    captures: Iterable[dict[str, Any]], *, artifacts_root: Path
+) -> Iterator[tuple[str, dict[str, Any], PaperBundle]]:
+    """(capture_id, cap_row, bundle) in input order; see _iter_prefetched."""
+
+    def _load(cap_id: str, cap: dict[str, Any]) -> PaperBundle:
+        return PaperBundle.load_best_effort(
+            artifacts_root=artifacts_root, capture_id=cap_id, cap_row=cap
+        )
+
+    return _iter_prefetched(captures, _load)
+
 
 def _slug(s: str) -> str:
     s = (s or "").strip().lower()
-    s = re.sub(r"[^a-z0-9]+", "-", s)
-    s = re.sub(r"-{2,}", "-", s).strip("-")
+    # Each run of non-alnum chars becomes one "-", so no "--" can survive.
+    s = _SLUG_NONALNUM_RX.sub("-", s).strip("-")
     return s[:80] if s else "export"
 
 
 @dataclass(frozen=True)
 class ExportContext:
-    captures: list[dict]
+    captures: Iterable[dict]
     capture_id: str | None
     col_id: int | None
     col_name: str | None
@@ -34,18 +81,25 @@ def select_export_context(
     *,
     capture_id: str | None,
     col: str | None,
+    citation_only: bool = False,
 ) -> ExportContext:
     """
     Service-level decision logic:
       - if capture_id provided => export that one capture (if it exists; otherwise empty)
       - else if collection id provided => export that collection (and attach col_name)
       - else => export all
+
+    Collection/all captures come back as a cursor-backed iterator (single pass,
+    needs the DB open while consumed).
+    citation_only=True narrows meta_json to what BibTeX/RIS read (see exports_repo).
     """
     cap_id = (capture_id or "").strip() or None
     col_raw = (col or "").strip() or None
 
     if cap_id:
-        cap = exports_repo.get_capture_by_id(db, capture_id=cap_id)
+        cap = exports_repo.get_capture_by_id(
+            db, capture_id=cap_id, citation_only=citation_only
+        )
         caps = [cap] if cap else []
         return ExportContext(
             captures=caps, capture_id=cap_id, col_id=None, col_name=None
@@ -53,13 +107,15 @@ def select_export_context(
 
     col_id = safe_int(col_raw)
     if col_id and col_id > 0:
-        caps = exports_repo.list_captures_in_collection(db, collection_id=int(col_id))
+        caps = exports_repo.iter_captures_in_collection(
+            db, collection_id=int(col_id), citation_only=citation_only
+        )
         col_name = exports_repo.get_collection_name(db, collection_id=int(col_id))
         return ExportContext(
             captures=caps, capture_id=None, col_id=int(col_id), col_name=col_name
         )
 
-    caps = exports_repo.list_all_captures(db)
+    caps = exports_repo.iter_all_captures(db, citation_only=citation_only)
     return ExportContext(captures=caps, capture_id=None, col_id=None, col_name=None)
 
 
@@ -93,19 +149,27 @@ def export_filename(
 ExportKind = Literal["bibtex", "ris"]
 
 
-def render_export(*, kind: ExportKind, captures: list[dict]) -> tuple[str, str]:
+def render_export(
+    *, kind: ExportKind, captures: Iterable[dict]
+) -> tuple[Iterator[str], str]:
     """
-    Returns (body, mimetype).
+    Returns (body, mimetype). The body is a lazy iterator of entry chunks so the
+    download can be streamed; "".join() it for a string.
     """
     if kind == "bibtex":
-        return captures_to_bibtex(captures), "application/x-bibtex"
+        return iter_bibtex(captures), "application/x-bibtex"
     if kind == "ris":
-        return captures_to_ris(captures), "application/x-research-info-systems"
+        return iter_ris(captures), "application/x-research-info-systems"
     raise ValueError(f"Unknown export kind: {kind}")
 
 
-def select_captures_by_ids(db, *, capture_ids: list[str]) -> list[dict]:
-    return exports_repo.select_captures_by_ids(db, capture_ids=capture_ids)
+def select_captures_by_ids(
+    db, *, capture_ids: list[str], citation_only: bool = False
+) -> Iterable[dict]:
+    """Cursor-backed iterator; citation_only: see select_export_context."""
+    return exports_repo.iter_captures_by_ids(
+        db, capture_ids=capture_ids, citation_only=citation_only
+    )
 
 
 def export_download_parts_from_args(
@@ -113,14 +177,14 @@ def export_download_parts_from_args(
     *,
     kind: ExportKind,
     args: Mapping[str, Any],
-) -> tuple[str, str, str]:
+) -> tuple[Iterable[str], str, str]:
     """
     Thin-route helper: parse args, select captures, render, and return (body, mimetype, filename).
     """
     col = get_collection_arg(args) or None
     capture_id = (str(args.get("capture_id") or "")).strip() or None
 
-    ctx = select_export_context(db, capture_id=capture_id, col=col)
+    ctx = select_export_context(db, capture_id=capture_id, col=col, citation_only=True)
     body, mimetype = render_export(kind=kind, captures=ctx.captures)
 
     ext = "bib" if kind == "bibtex" else "ris"
@@ -139,11 +203,11 @@ def export_selected_download_parts(
     *,
     kind: ExportKind,
     capture_ids: list[str],
-) -> tuple[str, str, str]:
+) -> tuple[Iterable[str], str, str]:
     """
     Thin-route helper for selected exports: returns (body, mimetype, filename).
     """
-    captures = select_captures_by_ids(db, capture_ids=capture_ids)
+    captures = select_captures_by_ids(db, capture_ids=capture_ids, citation_only=True)
     body, mimetype = render_export(kind=kind, captures=captures)
 
     ext = "bib" if kind == "bibtex" else "ris"
@@ -162,48 +226,52 @@ def export_selected_download_parts(
 # -------------------------
 
 
-def render_master_markdown(
+def iter_master_markdown(
     *,
-    captures: list[dict[str, Any]],
+    captures: Iterable[dict[str, Any]],
     artifacts_root: Path,
     title: str,
-) -> str:
+    count: int | None = None,
+) -> Iterator[str]:
     """
-    Concatenate bundle markdown blobs with a simple top header + separators.
+    Yield the master markdown one paper at a time, so large collections can be
+    streamed: a top header, then each paper's markdown between separators.
+
+    `count` is the header's item count; pass it when `captures` is a lazy
+    iterator (otherwise len(captures) is used).
     """
-    out: list[str] = []
-    out.append(f"# {title}".strip())
-    out.append("")
-    out.append(f"_Items: {len(captures)}_")
-    out.append("")
+    n = count if count is not None else len(captures)  # type: ignore[arg-type]
+    yield f"# {title}".strip() + "\n\n" + f"_Items: {n}_" + "\n"
+
+    def _load_md(cap_id: str, cap: dict[str, Any]) -> str:
+        # Most captures have paper.md on disk; only load the full bundle (reduced/
+        # sections/references JSON) when we need to synthesize markdown.
+        blob = PaperBundle.read_paper_md(
+            artifacts_root=artifacts_root, capture_id=cap_id
+        ).strip()
+        if not blob:
+            bundle = PaperBundle.load_best_effort(
+                artifacts_root=artifacts_root, capture_id=cap_id, cap_row=cap
+            )
+            blob = (bundle.best_paper_md() or "").strip()
+        return blob
 
     first = True
-    for cap in captures:
-        cap_id = str(cap.get("id") or "").strip()
-        if not cap_id:
-            continue
-
-        bundle = PaperBundle.load_best_effort(
-            artifacts_root=artifacts_root, capture_id=cap_id, cap_row=cap
-        )
-        blob = (bundle.best_paper_md() or "").strip()
+    for _cap_id, _cap, blob in _iter_prefetched(captures, _load_md):
         if not blob:
             continue
 
-        if not first:
-            out.append("\n---\n")
-        out.append(blob.rstrip() + "\n")
+        sep = "\n" if first else "\n\n---\n\n"
+        yield sep + blob.rstrip() + "\n"
         first = False
 
-    return "\n".join(out).rstrip() + "\n"
-
 
 def master_md_download_parts_from_args(
     db,
     *,
     args: Mapping[str, Any],
     artifacts_root: Path,
-) -> tuple[str, str, str]:
+) -> tuple[Iterable[str], str, str]:
     """
     GET /exports/master.md/?collection=<id>&capture_id=<id>
     """
@@ -212,6 +280,14 @@ def master_md_download_parts_from_args(
 
     ctx = select_export_context(db, capture_id=capture_id, col=col)
 
+    # The header needs the item count before the first row is streamed.
+    if ctx.capture_id:
+        count = None
+    elif ctx.col_id:
+        count = exports_repo.count_captures_in_collection(db, collection_id=ctx.col_id)
+    else:
+        count = exports_repo.count_all_captures(db)
+
     title = "Paperclip Master Export"
     if ctx.col_name:
         title = f"Paperclip Master Export — {ctx.col_name}"
@@ -220,10 +296,11 @@ def master_md_download_parts_from_args(
     elif ctx.capture_id:
         title = f"Paperclip Master Export — {ctx.capture_id}"
 
-    body = render_master_markdown(
+    body = iter_master_markdown(
         captures=ctx.captures,
         artifacts_root=artifacts_root,
         title=title,
+        count=count,
     )
     mimetype = "text/markdown; charset=utf-8"
     filename = export_filename(
@@ -242,10 +319,11 @@ def master_md_selected_download_parts(
     *,
     capture_ids: list[str],
     artifacts_root: Path,
-) -> tuple[str, str, str]:
-    captures = select_captures_by_ids(db, capture_ids=capture_ids)
+) -> tuple[Iterable[str], str, str]:
+    # The header needs the item count up front; selections are small.
+    captures = list(select_captures_by_ids(db, capture_ids=capture_ids))
 
-    body = render_master_markdown(
+    body = iter_master_markdown(
         captures=captures,
         artifacts_root=artifacts_root,
         title="Paperclip Master Export — Selected",
@@ -267,38 +345,35 @@ def master_md_selected_download_parts(
 # -------------------------
 
 
-def render_sections_export_json(
+def iter_sections_export_json(
     *,
-    captures: list[dict[str, Any]],
+    captures: Iterable[dict[str, Any]],
     artifacts_root: Path,
-) -> str:
+) -> Iterator[str]:
     """
-    Returns a JSON string: list[dict] where each dict is:
+    Yield the sections JSON array one element at a time; "".join() is a JSON
+    list[dict] (indent=2, sort_keys, trailing newline) where each dict is:
       { id, title, url, doi, year, container_title, sections: [...] }
     """
-    out: list[dict[str, Any]] = []
-    for cap in captures:
-        cap_id = str(cap.get("id") or "").strip()
-        if not cap_id:
-            continue
-
-        bundle = PaperBundle.load_best_effort(
-            artifacts_root=artifacts_root, capture_id=cap_id, cap_row=cap
-        )
-
-        out.append(
-            {
-                "id": cap_id,
-                "title": str(cap.get("title") or ""),
-                "url": str(cap.get("url") or ""),
-                "doi": str(cap.get("doi") or ""),
-                "year": cap.get("year", None),
-                "container_title": str(cap.get("container_title") or ""),
-                "sections": bundle.standardized_sections(),
-            }
-        )
+    first = True
+    for cap_id, cap, bundle in _iter_bundles(captures, artifacts_root=artifacts_root):
+        item = {
+            "id": cap_id,
+            "title": str(cap.get("title") or ""),
+            "url": str(cap.get("url") or ""),
+            "doi": str(cap.get("doi") or ""),
+            "year": cap.get("year", None),
+            "container_title": str(cap.get("container_title") or ""),
+            "sections": bundle.standardized_sections(),
+        }
+        blob = json.dumps(item, ensure_ascii=False, indent=2, sort_keys=True)
+        # Re-indent one level as an array element; JSON strings never contain raw
+        # newlines, so splitting on "\n" only touches layout.
+        elem = "\n".join("  " + line for line in blob.split("\n"))
+        yield ("[\n" if first else ",\n") + elem
+        first = False
 
-    return json.dumps(out, ensure_ascii=False, indent=2, sort_keys=True) + "\n"
+    yield "[]\n" if first else "\n]\n"
 
 
 def sections_json_download_parts_from_args(
@@ -306,7 +381,7 @@ def sections_json_download_parts_from_args(
     *,
     args: Mapping[str, Any],
     artifacts_root: Path,
-) -> tuple[str, str, str]:
+) -> tuple[Iterable[str], str, str]:
     """
     GET /exports/sections.json/?collection=<id>&capture_id=<id>
     """
@@ -315,7 +390,7 @@ def sections_json_download_parts_from_args(
 
     ctx = select_export_context(db, capture_id=capture_id, col=col)
 
-    body = render_sections_export_json(
+    body = iter_sections_export_json(
         captures=ctx.captures, artifacts_root=artifacts_root
     )
     mimetype = "application/json; charset=utf-8"
@@ -335,13 +410,13 @@ def sections_json_selected_download_parts(
     *,
     capture_ids: list[str],
     artifacts_root: Path,
-) -> tuple[str, str, str]:
+) -> tuple[Iterable[str], str, str]:
     """
     POST /exports/sections.json/selected/ with capture_ids
     """
     captures = select_captures_by_ids(db, capture_ids=capture_ids)
 
-    body = render_sections_export_json(captures=captures, artifacts_root=artifacts_root)
+    body = iter_sections_export_json(captures=captures, artifacts_root=artifacts_root)
     mimetype = "application/json; charset=utf-8"
     filename = export_filename(
         ext="json",
@@ -359,29 +434,19 @@ def sections_json_selected_download_parts(
 # -------------------------
 
 
-def render_papers_export_jsonl(
+def iter_papers_export_jsonl(
     *,
-    captures: list[dict[str, Any]],
+    captures: Iterable[dict[str, Any]],
     artifacts_root: Path,
-) -> str:
+) -> Iterator[str]:
     """
-    Returns NDJSON (JSONL) with one line per capture.
+    Yield NDJSON (JSONL) one line per capture (each chunk ends with "\n").
 
     Line shape is owned by paperclip.kb_schema (papers_jsonl_record).
     """
-    lines: list[str] = []
-    for cap in captures:
-        cap_id = str(cap.get("id") or "").strip()
-        if not cap_id:
-            continue
-
-        bundle = PaperBundle.load_best_effort(
-            artifacts_root=artifacts_root, capture_id=cap_id, cap_row=cap
-        )
+    for _cap_id, _cap, bundle in _iter_bundles(captures, artifacts_root=artifacts_root):
         obj = papers_jsonl_record(bundle)
-        lines.append(json.dumps(obj, ensure_ascii=False, separators=(",", ":")))
-
-    return "\n".join(lines).rstrip() + ("\n" if lines else "")
+        yield json.dumps(obj, ensure_ascii=False, separators=(",", ":")) + "\n"
 
 
 def papers_jsonl_download_parts_from_args(
@@ -389,7 +454,7 @@ def papers_jsonl_download_parts_from_args(
     *,
     args: Mapping[str, Any],
     artifacts_root: Path,
-) -> tuple[str, str, str]:
+) -> tuple[Iterable[str], str, str]:
     """
     GET /exports/papers.jsonl/?collection=<id>&capture_id=<id>
     """
@@ -398,7 +463,7 @@ def papers_jsonl_download_parts_from_args(
 
     ctx = select_export_context(db, capture_id=capture_id, col=col)
 
-    body = render_papers_export_jsonl(
+    body = iter_papers_export_jsonl(
         captures=ctx.captures, artifacts_root=artifacts_root
     )
     mimetype = "application/x-ndjson; charset=utf-8"
@@ -418,13 +483,13 @@ def papers_jsonl_selected_download_parts(
     *,
     capture_ids: list[str],
     artifacts_root: Path,
-) -> tuple[str, str, str]:
+) -> tuple[Iterable[str], str, str]:
     """
     POST /exports/papers.jsonl/selected/ with capture_ids
     """
     captures = select_captures_by_ids(db, capture_ids=capture_ids)
 
-    body = render_papers_export_jsonl(captures=captures, artifacts_root=artifacts_root)
+    body = iter_papers_export_jsonl(captures=captures, artifacts_root=artifacts_root)
     mimetype = "application/x-ndjson; charset=utf-8"
     filename = export_filename(
         ext="jsonl",
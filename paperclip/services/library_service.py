@@ -3,7 +3,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Callable, Mapping
 
-from ..present import present_capture_for_api, present_capture_for_library
+from ..present import (
+    present_capture_for_library,
+    present_capture_for_library_and_api,
+)
 from ..queryparams import LibraryParams, library_params_from_args
 from ..repo import collections_repo, library_repo
 
@@ -20,6 +23,7 @@ class LibraryPageModel:
     total: int
     has_more: bool
     fts_enabled: bool
+    next_cursor: str = ""
 
 
 @dataclass(frozen=True)
@@ -30,6 +34,16 @@ class ApiLibraryPayload:
     page_size: int
     total: int
     has_more: bool
+    next_cursor: str = ""
+
+
+def _next_cursor(captures: list[dict[str, Any]], has_more: bool) -> str:
+    if not has_more or not captures:
+        return ""
+    last = captures[-1]
+    return library_repo.encode_cursor(
+        str(last.get("updated_at") or ""), str(last.get("id") or "")
+    )
 
 
 def build_library_page_model(
@@ -39,7 +53,6 @@ def build_library_page_model(
     fts_enabled: bool,
 ) -> LibraryPageModel:
     collections = collections_repo.list_collections_with_counts(db)
-    total_all = library_repo.count_all_captures(db)
 
     captures, total, has_more = library_repo.search_captures(
         db,
@@ -48,8 +61,15 @@ def build_library_page_model(
         page=params.page,
         page_size=params.page_size,
         fts_enabled=fts_enabled,
+        after=params.after,
     )
 
+    # Unfiltered view: the search COUNT already is the library total.
+    unfiltered = not (
+        params.q or ""
+    ).strip() and not library_repo.has_collection_filter(params.selected_col)
+    total_all = total if unfiltered else library_repo.count_all_captures(db)
+
     out_caps = [present_capture_for_library(c) for c in captures]
 
     return LibraryPageModel(
@@ -63,6 +83,7 @@ def build_library_page_model(
         total=total,
         has_more=has_more,
         fts_enabled=fts_enabled,
+        next_cursor=_next_cursor(captures, has_more),
     )
 
 
@@ -80,10 +101,13 @@ def build_api_library_payload(
         page=params.page,
         page_size=params.page_size,
         fts_enabled=fts_enabled,
+        after=params.after,
     )
 
-    rows_caps = [present_capture_for_library(c) for c in captures]
-    out_caps = [present_capture_for_api(c) for c in captures]
+    # Rows HTML and JSON captures share one DTO/citation build per row.
+    pairs = [present_capture_for_library_and_api(c) for c in captures]
+    rows_caps = [lib for lib, _ in pairs]
+    out_caps = [api for _, api in pairs]
 
     rows_html = render_rows(rows_caps)
 
@@ -94,6 +118,7 @@ def build_api_library_payload(
         page_size=params.page_size,
         total=total,
         has_more=has_more,
+        next_cursor=_next_cursor(captures, has_more),
     )
 
 
@@ -120,6 +145,7 @@ def library_page_context_from_args(
         "total": model.total,
         "has_more": model.has_more,
         "fts_enabled": model.fts_enabled,
+        "next_cursor": model.next_cursor,
     }
 
 
@@ -145,4 +171,5 @@ def api_library_response_from_args(
         "page_size": payload.page_size,
         "total": payload.total,
         "has_more": payload.has_more,
+        "next_cursor": payload.next_cursor,
     }
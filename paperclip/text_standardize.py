@@ -17,6 +17,9 @@ _ZERO_WIDTH = {
 _SOFT_HYPHEN = "\u00ad"
 _NBSP = "\u00a0"
 
+_HSPACE_RX = re.compile(r"[ \t\f\v]+")
+_BLANK_LINES_RX = re.compile(r"\n{3,}")
+
 
 def normalize_unicode_whitespace(text: str) -> str:
     """
@@ -55,10 +58,10 @@ def normalize_unicode_whitespace(text: str) -> str:
     s = "\n".join([ln.rstrip() for ln in s.split("\n")])
 
     # Collapse runs of spaces/tabs (but keep newlines)
-    s = re.sub(r"[ \t\f\v]+", " ", s)
+    s = _HSPACE_RX.sub(" ", s)
 
     # Collapse excessive blank lines (keep paragraph breaks)
-    s = re.sub(r"\n{3,}", "\n\n", s)
+    s = _BLANK_LINES_RX.sub("\n\n", s)
 
     return s.strip()
 
@@ -102,8 +105,11 @@ def dehyphenate_linewrap(text: str) -> str:
 # --- UI / CTA line stripping ----------------------------------------------
 
 
+_WS_RX = re.compile(r"\s+")
+
+
 def _norm_line_for_match(line: str) -> str:
-    return re.sub(r"\s+", " ", (line or "").strip()).casefold()
+    return _WS_RX.sub(" ", (line or "").strip()).casefold()
 
 
 # Small, high-precision set of "UI-ish" lines to drop if they appear alone.
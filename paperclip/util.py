@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import shutil
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Iterable, Union
 
@@ -37,3 +39,45 @@ def rmtree_best_effort(paths: Iterable[Pathish]) -> None:
                 pass
         except Exception:
             pass
+
+
+# Single background worker for deferred deletes; pending work is finished at exit.
+_RMTREE_BG = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rmtree")
+# Renamed-aside trees are ".<name>.deleting-<hex8>" next to the original.
+_DELETING_GLOB = ".*.deleting-*"
+
+
+def rmtree_deferred(paths: Iterable[Pathish]) -> None:
+    """
+    Like rmtree_best_effort, but only renames each path aside (one cheap,
+    atomic rename per path) before returning; the slow recursive delete runs on
+    a background thread. Paths that can't be renamed are deleted inline.
+    """
+    doomed: list[Path] = []
+    for p in paths:
+        src = Path(p)
+        dst = src.with_name(f".{src.name}.deleting-{uuid.uuid4().hex[:8]}")
+        try:
+            src.rename(dst)
+        except FileNotFoundError:
+            continue
+        except Exception:
+            rmtree_best_effort([src])
+            continue
+        doomed.append(dst)
+
+    if doomed:
+        _RMTREE_BG.submit(rmtree_best_effort, doomed)
+
+
+def sweep_deferred_rmtrees(root: Path) -> None:
+    """
+    Queue deletion of trees rmtree_deferred renamed aside directly under root
+    but never finished deleting (e.g. the process died first). Never raises.
+    """
+    try:
+        leftovers = list(root.glob(_DELETING_GLOB))
+    except OSError:
+        return
+    if leftovers:
+        _RMTREE_BG.submit(rmtree_best_effort, leftovers)
@@ -28,6 +28,7 @@
       const ds = cfgEl.dataset || {};
       if (ds.apiBase) base.api_base = ds.apiBase;
       if (ds.nextPage) base.next_page = parseInt(ds.nextPage, 10);
+      if (ds.nextCursor) base.next_cursor = ds.nextCursor;
       if (ds.pageSize) base.page_size = parseInt(ds.pageSize, 10);
       if (ds.hasMore != null)
         base.has_more = ds.hasMore === "1" || ds.hasMore === "true";
@@ -39,6 +40,8 @@
     const pageSize = cfg.page_size || 50;
 
     let nextPage = cfg.next_page || 2;
+    // Keyset cursor from the server; when present it replaces OFFSET paging.
+    let nextCursor = cfg.next_cursor || "";
     let hasMore = !!cfg.has_more;
     let loading = false;
 
@@ -86,12 +89,13 @@
       return { q, collection, page_size: ps };
     }
 
-    function buildApiUrl(page) {
+    function buildApiUrl(page, after) {
       const f = currentFilters();
       const sp = new URLSearchParams();
       if (f.q) sp.set("q", f.q);
       if (f.collection) sp.set("collection", f.collection);
       sp.set("page", String(page));
+      if (after) sp.set("after", after);
       sp.set("page_size", f.page_size || String(pageSize));
       return API_BASE + "?" + sp.toString();
     }
@@ -117,7 +121,7 @@
       setLoading(true);
 
       try {
-        const url = buildApiUrl(nextPage);
+        const url = buildApiUrl(nextPage, nextCursor);
         const res = await fetch(url, {
           headers: { "X-Requested-With": "fetch" },
         });
@@ -128,6 +132,7 @@
 
         hasMore = !!(data && data.has_more);
         nextPage = data && data.page ? data.page + 1 : nextPage + 1;
+        nextCursor = (data && data.next_cursor) || "";
 
         setLoading(false);
         if (!hasMore) setEnd();
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from paperclip import artifacts
+from paperclip.constants import ALLOWED_ARTIFACTS
 
 
 def test_read_text_artifact_truncates(tmp_path):
@@ -23,3 +24,28 @@ def test_read_text_artifact_truncates(tmp_path):
     assert r["exists"] is True
     assert r["truncated"] is True
     assert "… (truncated)" in r["text"]
+
+
+def test_list_present_artifacts_treats_equal_allow_lists_alike(tmp_path):
+    cap_dir = tmp_path / "cap1"
+    cap_dir.mkdir(parents=True)
+    (cap_dir / "paper.md").write_text("x", encoding="utf-8")
+    (cap_dir / "article.txt").write_text("x", encoding="utf-8")
+    (cap_dir / "not-allowed.bin").write_text("x", encoding="utf-8")
+    (cap_dir / "reduced.json").mkdir()  # allowed name, but not a file
+
+    default = artifacts.list_present_artifacts(
+        artifacts_root=tmp_path, capture_id="cap1"
+    )
+    for allow in (
+        list(ALLOWED_ARTIFACTS),
+        tuple(ALLOWED_ARTIFACTS),
+        set(ALLOWED_ARTIFACTS),
+    ):
+        assert (
+            artifacts.list_present_artifacts(
+                artifacts_root=tmp_path, capture_id="cap1", allowed_artifacts=allow
+            )
+            == default
+            == ["article.txt", "paper.md"]
+        )
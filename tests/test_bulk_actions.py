@@ -112,3 +112,84 @@ def test_bulk_add_remove_and_export_selected(client, app):
     body2 = ris.get_data(as_text=True)
     assert "DO  - 10.1111/aaa" in body2
     assert "10.2222/bbb" not in body2
+
+
+def test_bulk_collection_membership_counts(client, app):
+    from paperclip.repo import captures_repo
+
+    id1 = _post_capture(client, "https://example.org/c", "10.3333/ccc")
+    id2 = _post_capture(client, "https://example.org/d", "10.4444/ddd")
+
+    with app.app_context():
+        db = get_db()
+        db.execute(
+            "INSERT INTO collections (name, created_at) VALUES (?, datetime('now'))",
+            ("Counts",),
+        )
+        col_id = db.execute(
+            "SELECT id FROM collections WHERE name = ?", ("Counts",)
+        ).fetchone()["id"]
+
+        now = "2030-01-01T00:00:00Z"
+        added = captures_repo.bulk_add_to_collection(
+            db, capture_ids=[id1], collection_id=col_id, now=now
+        )
+        assert added == 1
+
+        # Existing memberships are ignored; duplicates in the input count once.
+        added = captures_repo.bulk_add_to_collection(
+            db, capture_ids=[id1, id2, id2], collection_id=col_id, now=now
+        )
+        assert added == 1
+
+        touched = db.execute(
+            "SELECT COUNT(1) AS n FROM captures WHERE updated_at = ?", (now,)
+        ).fetchone()["n"]
+        assert touched == 2
+
+        removed = captures_repo.bulk_remove_from_collection(
+            db, capture_ids=[id1, id2], collection_id=col_id, now=now
+        )
+        assert removed == 2
+
+
+def test_collection_counts_follow_membership_changes(client, app):
+    from paperclip.repo import captures_repo, collections_repo
+
+    id1 = _post_capture(client, "https://example.org/e", "10.5555/eee")
+    id2 = _post_capture(client, "https://example.org/f", "10.6666/fff")
+
+    def _count(db, col_id: int) -> int:
+        for c in collections_repo.list_collections_with_counts(db):
+            if c["id"] == col_id:
+                return int(c["count"])
+        raise AssertionError("collection missing")
+
+    with app.app_context():
+        db = get_db()
+        collections_repo.create_collection(db, name="Tracked", created_at="x")
+        col_id = db.execute(
+            "SELECT id FROM collections WHERE name = ?", ("Tracked",)
+        ).fetchone()["id"]
+        assert _count(db, col_id) == 0
+
+        now = "2030-01-01T00:00:00Z"
+        captures_repo.bulk_add_to_collection(
+            db, capture_ids=[id1, id2, id2], collection_id=col_id, now=now
+        )
+        assert _count(db, col_id) == 2
+
+        captures_repo.bulk_remove_from_collection(
+            db, capture_ids=[id2], collection_id=col_id, now=now
+        )
+        assert _count(db, col_id) == 1
+        db.commit()
+
+    # Deleting the capture cascades to collection_items; the count follows.
+    r = client.post(
+        "/captures/delete/", data={"capture_ids": [id1]}, follow_redirects=True
+    )
+    assert r.status_code == 200
+
+    with app.app_context():
+        assert _count(get_db(), col_id) == 0
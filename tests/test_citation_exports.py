@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import json
+
+
+def _dom(*, doi: str, title: str) -> str:
+    return f"""<!doctype html>
+<html>
+  <head>
+    <title>{title}</title>
+    <meta name="citation_title" content="{title}">
+    <meta name="citation_doi" content="{doi}">
+    <meta name="citation_journal_title" content="Journal of Exports">
+  </head>
+  <body><article><p>Body of {title}.</p></article></body>
+</html>
+"""
+
+
+def _post_capture(client, *, source_url: str, doi: str, title: str) -> str:
+    payload = {
+        "source_url": source_url,
+        "dom_html": _dom(doi=doi, title=title),
+        "extraction": {"meta": {}, "references": []},
+        "rendered": {},
+        "client": {"ext": "chrome", "v": "0.1.0"},
+    }
+    r = client.post(
+        "/api/captures/", data=json.dumps(payload), content_type="application/json"
+    )
+    assert r.status_code in (200, 201)
+    return r.get_json()["capture_id"]
+
+
+def test_bibtex_and_ris_exports_stream_all_captures(client):
+    for i in range(3):
+        _post_capture(
+            client,
+            source_url=f"https://example.org/cite{i}",
+            doi=f"10.6000/cite{i}",
+            title=f"Cite Paper {i}",
+        )
+
+    # Rows are read from a live cursor while the body streams.
+    r = client.get("/exports/bibtex/")
+    assert r.status_code == 200
+    assert r.is_streamed
+    bib = r.get_data(as_text=True)
+    assert bib.count("@article{") == 3
+    assert bib.endswith("}\n")
+
+    r = client.get("/exports/ris/")
+    assert r.status_code == 200
+    ris = r.get_data(as_text=True)
+    assert ris.count("TY  - JOUR") == 3
+    assert ris.endswith("ER  -\n")
+
+    r = client.get("/exports/ris/?collection=999")
+    assert r.get_data(as_text=True) == ""
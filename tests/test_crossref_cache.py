@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import json
+import threading
+
+import pytest
+
+from paperclip import external_meta
+
+_MESSAGE = {
+    "title": ["Cached Title"],
+    "container-title": ["Journal of Caching"],
+    "issued": {"date-parts": [[2021, 5, 6]]},
+    "author": [{"given": "Ada", "family": "Lovelace"}],
+}
+
+
+class _FakeResp:
+    def __init__(self, payload: dict):
+        self._raw = json.dumps(payload).encode("utf-8")
+
+    def read(self) -> bytes:
+        return self._raw
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache(monkeypatch):
+    monkeypatch.setattr(external_meta, "_CROSSREF_MEM", {})
+    monkeypatch.setattr(external_meta, "_CROSSREF_INFLIGHT", {})
+
+
+def test_second_lookup_skips_network(monkeypatch):
+    calls: list[str] = []
+
+    def fake_urlopen(req, timeout=None):
+        calls.append(req.full_url)
+        return _FakeResp({"message": _MESSAGE})
+
+    monkeypatch.setattr(external_meta.urllib.request, "urlopen", fake_urlopen)
+
+    m1 = external_meta.fetch_crossref_metadata("10.1234/Cache.1")
+    m2 = external_meta.fetch_crossref_metadata(" 10.1234/cache.1 ")
+
+    assert len(calls) == 1
+    assert m1 == m2
+    assert m1 is not None and m1["authors"] == ["Ada Lovelace"]
+
+    # Callers get copies; mutating one must not leak into the cache.
+    m1["authors"].append("Mallory")
+    m3 = external_meta.fetch_crossref_metadata("10.1234/cache.1")
+    assert m3 is not None and m3["authors"] == ["Ada Lovelace"]
+
+
+def test_failed_lookup_is_cached_briefly(monkeypatch):
+    calls: list[str] = []
+    now = [1000.0]
+
+    def fake_urlopen(req, timeout=None):
+        calls.append(req.full_url)
+        raise external_meta.urllib.error.URLError("offline")
+
+    monkeypatch.setattr(external_meta.urllib.request, "urlopen", fake_urlopen)
+    monkeypatch.setattr(external_meta.time, "monotonic", lambda: now[0])
+
+    assert external_meta.fetch_crossref_metadata("10.1234/miss") is None
+    assert external_meta.fetch_crossref_metadata("10.1234/miss") is None
+    assert len(calls) == 1
+
+    # Misses expire on the short TTL, so a transient failure is retried.
+    now[0] += external_meta._CROSSREF_MISS_TTL_S + 1
+    assert external_meta.fetch_crossref_metadata("10.1234/miss") is None
+    assert len(calls) == 2
+
+
+def test_concurrent_lookups_are_coalesced(monkeypatch):
+    calls: list[str] = []
+    release = threading.Event()
+
+    def fake_urlopen(req, timeout=None):
+        calls.append(req.full_url)
+        release.wait(timeout=5)
+        return _FakeResp({"message": _MESSAGE})
+
+    monkeypatch.setattr(external_meta.urllib.request, "urlopen", fake_urlopen)
+
+    results: list[dict | None] = []
+
+    def worker() -> None:
+        results.append(external_meta.fetch_crossref_metadata("10.1234/shared"))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    while not calls:
+        threading.Event().wait(0.01)
+    release.set()
+    for t in threads:
+        t.join(timeout=5)
+
+    assert len(calls) == 1
+    assert len(results) == 4
+    assert all(r and r["title"] == "Cached Title" for r in results)
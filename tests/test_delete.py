@@ -1,8 +1,14 @@
 from __future__ import annotations
 
 import json
+import sqlite3
 from pathlib import Path
 
+from paperclip import util
+from paperclip.app import create_app
+from paperclip.db import get_db
+from paperclip.repo import captures_repo
+
 DOM_FOR_POST = """<!doctype html>
 <html>
   <head>
@@ -20,6 +26,11 @@ DOM_FOR_POST = """<!doctype html>
 CONTENT_FOR_POST = "<div><p>Hello A.</p><p>Hello B.</p></div>"
 
 
+def _drain_rmtree_bg() -> None:
+    # Single worker, FIFO: once a no-op submitted now runs, earlier deletes are done.
+    util._RMTREE_BG.submit(lambda: None).result(timeout=10)
+
+
 def test_delete_selected_captures_removes_db_rows_and_artifacts(client, app):
     payload = {
         "source_url": "https://example.org/post?utm_source=x#frag",
@@ -53,5 +64,115 @@ def test_delete_selected_captures_removes_db_rows_and_artifacts(client, app):
     g2 = client.get(f"/api/captures/{cap_id}/")
     assert g2.status_code == 404
 
-    # Artifacts removed
+    # Artifacts removed: renamed aside at once, then deleted in the background.
     assert not arts.exists()
+    _drain_rmtree_bg()
+    assert list(arts.parent.glob(f".{cap_id}.deleting-*")) == []
+
+
+def test_delete_multiple_captures_clears_fts_rows(client, app):
+    ids: list[str] = []
+    for i in range(3):
+        payload = {
+            "source_url": f"https://example.org/post-{i}",
+            "dom_html": DOM_FOR_POST.replace("10.9999/xyz.abc", f"10.9999/multi.{i}"),
+            "extraction": {
+                "meta": {},
+                "content_html": CONTENT_FOR_POST,
+                "references": [],
+            },
+            "rendered": {},
+            "client": {"ext": "chrome", "v": "0.1.0"},
+        }
+        r = client.post(
+            "/api/captures/", data=json.dumps(payload), content_type="application/json"
+        )
+        assert r.status_code in (200, 201)
+        ids.append(r.get_json()["capture_id"])
+
+    d = client.post(
+        "/captures/delete/",
+        data={"capture_ids": ids[:2], "next": "/library/"},
+        follow_redirects=False,
+    )
+    assert d.status_code in (302, 303)
+
+    assert client.get(f"/api/captures/{ids[0]}/").status_code == 404
+    assert client.get(f"/api/captures/{ids[1]}/").status_code == 404
+    assert client.get(f"/api/captures/{ids[2]}/").status_code == 200
+
+    if app.config.get("FTS_ENABLED"):
+        v = client.get("/api/maintenance/verify-fts/")
+        assert v.status_code == 200
+        assert v.get_json()["stats"]["ok"] is True
+
+
+def test_startup_sweeps_leftover_deferred_deletes(tmp_path):
+    arts_root = tmp_path / "data" / "artifacts"
+    leftover = arts_root / ".abc123.deleting-0badf00d"
+    (leftover / "sub").mkdir(parents=True)
+    (leftover / "sub" / "paper.md").write_text("x", encoding="utf-8")
+    keep = arts_root / "abc456"
+    keep.mkdir()
+
+    create_app(
+        {
+            "DATA_DIR": tmp_path / "data",
+            "DB_PATH": tmp_path / "data" / "db.sqlite3",
+            "ARTIFACTS_DIR": arts_root,
+            "SECRET_KEY": "test",
+        }
+    )
+    _drain_rmtree_bg()
+
+    assert not leftover.exists()
+    assert keep.is_dir()
+
+
+def test_bulk_statements_stay_under_sqlite_variable_limit(client, app):
+    real: list[str] = []
+    for i in range(3):
+        payload = {
+            "source_url": f"https://example.org/many-{i}",
+            "dom_html": DOM_FOR_POST.replace("10.9999/xyz.abc", f"10.9999/many.{i}"),
+            "extraction": {"meta": {}, "content_html": CONTENT_FOR_POST},
+        }
+        r = client.post(
+            "/api/captures/", data=json.dumps(payload), content_type="application/json"
+        )
+        real.append(r.get_json()["capture_id"])
+    ids = real + [f"missing-{i}" for i in range(1200)]
+
+    with app.app_context():
+        db = get_db()
+        # Older SQLite builds default to 999 bound variables per statement.
+        db.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999)
+        db.execute(
+            "INSERT INTO collections(name, created_at) VALUES('Many', datetime('now'))"
+        )
+        col_id = db.execute(
+            "SELECT id FROM collections WHERE name = 'Many'"
+        ).fetchone()[0]
+        now = "2026-01-01T00:00:00Z"
+
+        assert captures_repo.list_existing_capture_ids(db, capture_ids=ids) == real
+        assert (
+            captures_repo.bulk_add_to_collection(
+                db, capture_ids=real, collection_id=col_id, now=now
+            )
+            == 3
+        )
+        assert (
+            captures_repo.bulk_remove_from_collection(
+                db, capture_ids=ids, collection_id=col_id, now=now
+            )
+            == 3
+        )
+        deleted = captures_repo.delete_captures(
+            db, capture_ids=ids, fts_enabled=bool(app.config.get("FTS_ENABLED"))
+        )
+        db.commit()
+
+    assert deleted == 3
+    for cid in real:
+        assert client.get(f"/api/captures/{cid}/").status_code == 404
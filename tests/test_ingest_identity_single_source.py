@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from paperclip import ingest, ingest_identity, ingest_upsert
+from paperclip.db import get_db
+from paperclip.urlnorm import canonicalize_url, url_hash
+
+
+def test_identity_decision_is_defined_once():
+    # ingest_upsert must consume the dedupe decision type, not redefine it.
+    assert ingest_upsert.IdentityDecision is ingest_identity.IdentityDecision
+    assert ingest.IdentityDecision is ingest_identity.IdentityDecision
+
+
+def _post_capture(client, *, source_url: str, doi: str | None) -> str:
+    doi_meta = f'<meta name="citation_doi" content="{doi}">' if doi else ""
+    payload = {
+        "source_url": source_url,
+        "dom_html": f"<html><head><title>T</title>{doi_meta}</head><body></body></html>",
+        "extraction": {"meta": {}, "content_html": "<p>Hello.</p>", "references": []},
+    }
+    r = client.post(
+        "/api/captures/", data=json.dumps(payload), content_type="application/json"
+    )
+    assert r.status_code in (200, 201)
+    return r.get_json()["capture_id"]
+
+
+def _dedupe_traced(app, tmp_path: Path, *, doi: str, source_url: str):
+    with app.app_context():
+        db = get_db()
+        statements: list[str] = []
+        db.set_trace_callback(statements.append)
+        try:
+            decision = ingest_identity.dedupe_identity(
+                db=db,
+                dto={"doi": doi},
+                url_hash_value=url_hash(canonicalize_url(source_url)),
+                artifacts_root=tmp_path,
+                fts_enabled=False,
+                now="2026-01-01T00:00:00Z",
+            )
+        finally:
+            db.set_trace_callback(None)
+    return decision, [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+
+
+def test_dedupe_matches_doi_and_url_hash_in_one_query(client, app, tmp_path):
+    doi = "10.5555/identity.1"
+    cap_id = _post_capture(client, source_url="https://example.org/a", doi=doi)
+
+    decision, selects = _dedupe_traced(
+        app, tmp_path, doi=doi, source_url="https://example.org/a"
+    )
+
+    assert decision.capture_id == cap_id
+    assert decision.created is False
+    assert decision.cleanup_dirs == []
+    assert len(selects) == 1
+
+
+def test_dedupe_falls_back_to_url_hash_in_one_query(client, app, tmp_path):
+    cap_id = _post_capture(client, source_url="https://example.org/b", doi=None)
+
+    decision, selects = _dedupe_traced(
+        app, tmp_path, doi="", source_url="https://example.org/b"
+    )
+    assert decision.capture_id == cap_id
+    assert decision.created is False
+    assert len(selects) == 1
+
+    decision, selects = _dedupe_traced(
+        app, tmp_path, doi="", source_url="https://example.org/new"
+    )
+    assert decision.created is True
+    assert len(selects) == 1
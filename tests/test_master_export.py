@@ -117,6 +117,7 @@ def test_export_master_md_collection_filters(client, app):
     assert "In Collection" in body
     assert "Out of Collection" not in body
     assert "Only These" in body  # title includes collection name
+    assert "_Items: 1_" in body  # header count comes from a COUNT before streaming
 
 
 def test_export_selected_master_md_only_includes_selected(client):
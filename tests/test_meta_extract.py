@@ -122,3 +122,31 @@ def test_ingest_extracts_authors_from_citation_authors_plural(client, app):
         "da Silveira Lobo O'Reilly Sternberg L",
     ]
     assert any(a == "Janos DP" for a in reduced["authors"])
+
+
+def test_get_authors_prefers_csl_literal_names():
+    from paperclip.metaschema import get_authors
+
+    meta = {
+        "authors": [
+            {"literal": " Human Genome Consortium "},
+            {"given": "Ada", "family": "Lovelace"},
+            {"literal": "", "name": "Fallback Name"},
+        ]
+    }
+    assert get_authors(meta) == [
+        "Human Genome Consortium",
+        "Ada Lovelace",
+        "Fallback Name",
+    ]
+
+
+def test_authors_short_uses_family_name_from_family_comma_given():
+    from paperclip.citation import citation_fields_from_parts
+
+    def short(authors):
+        return citation_fields_from_parts(authors=authors, abstract="")["authors_short"]
+
+    assert short(["Lovelace, Ada"]) == "Lovelace"
+    assert short(["Ada Lovelace", "Hopper, Grace M."]) == "Lovelace & Hopper"
+    assert short(["Ada Lovelace,", "B", "C"]) == "Lovelace et al."
@@ -117,3 +117,20 @@ def test_capture_detail_page_renders_with_parsed_context(client, app):
     assert "Parsed text" in body
     assert "Article body" in body
     assert "References" in body
+
+    art = client.get(f"/captures/{cap_id}/artifact/article.txt")
+    assert art.status_code == 200
+    etag = art.headers.get("ETag")
+    assert etag and art.headers.get("Last-Modified")
+    art.close()
+
+    # Reloads revalidate instead of re-downloading the artifact
+    again = client.get(
+        f"/captures/{cap_id}/artifact/article.txt", headers={"If-None-Match": etag}
+    )
+    assert again.status_code == 304
+    assert again.get_data() == b""
+    again.close()
+
+    missing = client.get("/captures/does-not-exist/artifact/article.txt")
+    assert missing.status_code == 404
@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 
 from paperclip.db import get_db
+from paperclip.repo import library_repo
 
 
 def _dom(*, doi: str, title: str) -> str:
@@ -142,3 +143,95 @@ def test_api_library_collection_filter(client, app):
     assert d["total"] == 1
     assert len(d["captures"]) == 1
     assert d["captures"][0]["id"] == id_in
+
+
+def test_api_library_keyset_cursor_walks_all_pages(client):
+    ids = {
+        _post_capture(
+            client,
+            source_url=f"https://example.org/k{i}",
+            doi=f"10.5555/k{i}",
+            title=f"Keyset Paper {i}",
+        )
+        for i in range(5)
+    }
+
+    d = client.get("/api/library/?page_size=2").get_json()
+    seen = [c["id"] for c in d["captures"]]
+    assert d["has_more"] is True
+    assert d["next_cursor"]
+
+    while d["has_more"]:
+        d = client.get(
+            "/api/library/",
+            query_string={"page_size": 2, "after": d["next_cursor"]},
+        ).get_json()
+        assert d["total"] == 5
+        seen.extend(c["id"] for c in d["captures"])
+
+    assert d["next_cursor"] == ""
+    assert len(seen) == len(set(seen)) == 5
+    assert set(seen) == ids
+
+
+def test_api_library_clamps_out_of_range_page(client):
+    r = client.get("/api/library/?page=99999999999999999999999&page_size=100000")
+    assert r.status_code == 200
+    d = r.get_json()
+    assert d["page_size"] == 500
+    assert d["captures"] == []
+    assert d["has_more"] is False
+
+
+def test_keyset_cursor_breaks_updated_at_ties_by_id(client, app):
+    for i in range(5):
+        _post_capture(
+            client,
+            source_url=f"https://example.org/tie{i}",
+            doi=f"10.5555/tie{i}",
+            title=f"Tie Paper {i}",
+        )
+
+    with app.app_context():
+        db = get_db()
+        db.execute("UPDATE captures SET updated_at = '2026-01-01T00:00:00Z'")
+        db.commit()
+        expected = [
+            r["id"] for r in db.execute("SELECT id FROM captures ORDER BY id DESC")
+        ]
+
+        statements: list[str] = []
+        db.set_trace_callback(statements.append)
+        try:
+            page, total, has_more = library_repo.search_captures(
+                db,
+                q="",
+                selected_col="",
+                page=1,
+                page_size=2,
+                fts_enabled=False,
+                after=library_repo.encode_cursor("2026-01-01T00:00:00Z", expected[1]),
+            )
+        finally:
+            db.set_trace_callback(None)
+
+        assert [c["id"] for c in page] == expected[2:4]
+        assert total == 5 and has_more is True
+
+        # The seek must be an index range on both key columns, not a scan.
+        seek_sql = next(s for s in statements if "LIMIT" in s)
+        plan = " ".join(
+            r["detail"] for r in db.execute("EXPLAIN QUERY PLAN " + seek_sql)
+        )
+        assert "SEARCH" in plan and "idx_captures_updated_at_id" in plan
+        assert "(updated_at,id)<(?,?)" in plan
+
+    d = client.get("/api/library/?page_size=2").get_json()
+    seen = [c["id"] for c in d["captures"]]
+    while d["has_more"]:
+        d = client.get(
+            "/api/library/",
+            query_string={"page_size": 2, "after": d["next_cursor"]},
+        ).get_json()
+        seen.extend(c["id"] for c in d["captures"])
+    assert seen == expected